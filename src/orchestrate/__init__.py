@@ -5,12 +5,55 @@ This package provides tools for defining, executing, and managing multi-step
 AI-powered workflows using a YAML specification.
 """
 
-from .models import Workflow, WorkflowStep, StepResult, WorkflowResult
-from .parser import load_workflow_from_yaml, load_workflow_from_file, workflow_to_yaml
-from .engine import execute_workflow, execute_step
-# Import SDK classes
-from .sdk import Workflow as WorkflowBuilder, Step as StepBuilder, Input, Output
-# Import visualizer functions
-from .visualizer import visualize_workflow_result, load_result_from_file
+import importlib
+from typing import TYPE_CHECKING
+
+# Public names and the submodule attribute each one refers to. Submodules are
+# imported on first access, so importing one part of the package (such as the
+# visualizer CLI) doesn't also load the parser, the engine and the OpenAI client.
+_EXPORTS = {
+    "Workflow": (".models", "Workflow"),
+    "WorkflowStep": (".models", "WorkflowStep"),
+    "StepResult": (".models", "StepResult"),
+    "WorkflowResult": (".models", "WorkflowResult"),
+    "load_workflow_from_yaml": (".parser", "load_workflow_from_yaml"),
+    "load_workflow_from_file": (".parser", "load_workflow_from_file"),
+    "save_workflow_to_file": (".parser", "save_workflow_to_file"),
+    "workflow_to_yaml": (".parser", "workflow_to_yaml"),
+    "workflow_to_json": (".parser", "workflow_to_json"),
+    "execute_workflow": (".engine", "execute_workflow"),
+    "execute_step": (".engine", "execute_step"),
+    # SDK classes
+    "WorkflowBuilder": (".sdk", "Workflow"),
+    "StepBuilder": (".sdk", "Step"),
+    "Input": (".sdk", "Input"),
+    "Output": (".sdk", "Output"),
+    # Visualizer functions
+    "visualize_workflow_result": (".visualizer", "visualize_workflow_result"),
+    "load_result_from_file": (".visualizer", "load_result_from_file"),
+}
+
+__all__ = [*_EXPORTS, "__version__"]
 
 __version__ = "0.1.0"
+
+def __getattr__(name: str):
+    """Import a public name from its submodule on first access (PEP 562)."""
+    try:
+        module_name, attr = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    # Later lookups find the name directly, without going through __getattr__
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted({*globals(), *_EXPORTS})
+
+if TYPE_CHECKING:
+    from .models import Workflow, WorkflowStep, StepResult, WorkflowResult
+    from .parser import load_workflow_from_yaml, load_workflow_from_file, save_workflow_to_file, workflow_to_yaml, workflow_to_json
+    from .engine import execute_workflow, execute_step
+    from .sdk import Workflow as WorkflowBuilder, Step as StepBuilder, Input, Output
+    from .visualizer import visualize_workflow_result, load_result_from_file
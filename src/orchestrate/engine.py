@@ -3,7 +3,7 @@ import time
 import os
 import re
 import json
-from typing import Dict, Any, Callable, Awaitable, Optional, List, Union
+from typing import Dict, Any, Callable, Awaitable, Optional, List, Tuple, Union
 
 from orchestrate.models import Workflow, WorkflowStep, StepResult, WorkflowResult, StepIO
 from orchestrate.llm import get_llm_client, generate_completion, generate_structured_completion
@@ -191,22 +191,155 @@ def extract_outputs(result: Any, step: WorkflowStep) -> Dict[str, Any]:
     
     return outputs
 
+def _step_layers(steps: List[WorkflowStep]) -> List[List[WorkflowStep]]:
+    """
+    Group workflow steps into layers of steps that can run concurrently.
+    
+    A step depends on the steps named as sources of its inputs. Each layer holds,
+    in workflow order, the steps whose dependencies are all in earlier layers.
+    
+    Args:
+        steps: The workflow steps
+        
+    Returns:
+        The steps grouped into layers, in execution order
+    """
+    step_ids = {step.id for step in steps}
+    completed = set()
+    remaining = list(steps)
+    layers = []
+    
+    while remaining:
+        layer = [
+            step for step in remaining
+            if all(input_spec.source in completed for input_spec in step.inputs if input_spec.source in step_ids)
+        ]
+        if not layer:
+            # Circular dependencies can never be satisfied; run the next step on its
+            # own so its missing input is reported as a step error
+            layer = remaining[:1]
+        layers.append(layer)
+        completed.update(step.id for step in layer)
+        scheduled = set(map(id, layer))
+        remaining = [step for step in remaining if id(step) not in scheduled]
+    
+    return layers
+
+async def _execute_workflow_step(
+    step: WorkflowStep,
+    context: Dict[str, Any],
+    step_executor: StepExecutor,
+    on_step_start: Optional[Callable[[str], None]],
+    on_step_complete: Optional[Callable[[str, Any], None]]
+) -> Tuple[StepResult, bool]:
+    """
+    Execute one step of a workflow, storing its result in the workflow context.
+    
+    Args:
+        step: The workflow step to execute
+        context: The workflow context, updated with the step's result on success
+        step_executor: Function to execute the step
+        on_step_start: Callback when the step starts
+        on_step_complete: Callback when the step completes
+        
+    Returns:
+        The step result, and whether the step succeeded
+    """
+    # Notify step start
+    if on_step_start:
+        on_step_start(step.id)
+        
+    # Execute the step
+    start_time = time.time()
+    try:
+        # Prepare step context with inputs
+        step_context = {}
+        
+        # Add global context
+        for key, value in context.items():
+            if not key.startswith("step_"):
+                step_context[key] = value
+        
+        # Process inputs
+        for input_spec in step.inputs:
+            try:
+                step_context[input_spec.name] = get_input_value(input_spec, context)
+            except ValueError as e:
+                raise ValueError(f"Error processing input for step {step.id}: {str(e)}")
+        
+        # Execute the step with the prepared context
+        result = await step_executor(step, step_context)
+        
+        # Extract outputs
+        outputs = extract_outputs(result, step)
+        
+        # Create step result with prompt and metadata
+        execution_time = time.time() - start_time
+        step_result = StepResult(
+            step_id=step.id,
+            result=result,
+            outputs=outputs,
+            execution_time=execution_time,
+            prompt=step_context.get("_current_prompt"),
+            model=step_context.get("_current_model"),
+            temperature=step_context.get("_current_temperature"),
+            system_message=step_context.get("_current_system_message")
+        )
+        
+        # Store the result in context under the step ID
+        context[step.id] = step_result.model_dump()
+        
+        # Notify step completion
+        if on_step_complete:
+            on_step_complete(step.id, result)
+        
+        return step_result, True
+            
+    except Exception as e:
+        # Handle step execution errors
+        execution_time = time.time() - start_time
+        error_message = f"Error executing step {step.id}: {str(e)}"
+        
+        # Create error step result
+        step_result = StepResult(
+            step_id=step.id,
+            result=error_message,
+            execution_time=execution_time,
+            prompt=step_context.get("_current_prompt"),
+            model=step_context.get("_current_model"),
+            temperature=step_context.get("_current_temperature"),
+            system_message=step_context.get("_current_system_message")
+        )
+        
+        # Notify step completion with error
+        if on_step_complete:
+            on_step_complete(step.id, error_message)
+        
+        return step_result, False
+
 async def execute_workflow(
     workflow: Workflow, 
     initial_context: Optional[Dict[str, Any]] = None,
     step_executor: StepExecutor = default_step_executor,
     on_step_start: Optional[Callable[[str], None]] = None,
-    on_step_complete: Optional[Callable[[str, Any], None]] = None
+    on_step_complete: Optional[Callable[[str, Any], None]] = None,
+    parallel: bool = False
 ) -> WorkflowResult:
     """
     Execute a workflow asynchronously.
     
+    By default steps run one at a time, in workflow order. With parallel=True,
+    steps whose inputs don't depend on each other run concurrently, layer by
+    layer; only the step sources of declared inputs count as dependencies.
+    Either way, execution stops after the first step (or layer) with an error.
+    
     Args:
         workflow: The workflow to execute
         initial_context: Initial context data
         step_executor: Function to execute each step
         on_step_start: Callback when a step starts
         on_step_complete: Callback when a step completes
+        parallel: Whether to run independent steps concurrently
         
     Returns:
         The result of the workflow execution
@@ -215,80 +348,27 @@ async def execute_workflow(
     step_results = {}
     workflow_start_time = time.time()
     
-    for step in workflow.steps:
-        # Notify step start
-        if on_step_start:
-            on_step_start(step.id)
-            
-        # Execute the step
-        start_time = time.time()
-        try:
-            # Prepare step context with inputs
-            step_context = {}
-            
-            # Add global context
-            for key, value in context.items():
-                if not key.startswith("step_"):
-                    step_context[key] = value
-            
-            # Process inputs
-            for input_spec in step.inputs:
-                try:
-                    step_context[input_spec.name] = get_input_value(input_spec, context)
-                except ValueError as e:
-                    raise ValueError(f"Error processing input for step {step.id}: {str(e)}")
-            
-            # Execute the step with the prepared context
-            result = await step_executor(step, step_context)
-            
-            # Extract outputs
-            outputs = extract_outputs(result, step)
-            
-            # Create step result with prompt and metadata
-            execution_time = time.time() - start_time
-            step_result = StepResult(
-                step_id=step.id,
-                result=result,
-                outputs=outputs,
-                execution_time=execution_time,
-                prompt=step_context.get("_current_prompt"),
-                model=step_context.get("_current_model"),
-                temperature=step_context.get("_current_temperature"),
-                system_message=step_context.get("_current_system_message")
-            )
-            
-            # Store the result in context under the step ID
-            context[step.id] = step_result.model_dump()
-            step_results[step.id] = step_result
-            
-            # Notify step completion
-            if on_step_complete:
-                on_step_complete(step.id, result)
-                
-        except Exception as e:
-            # Handle step execution errors
-            execution_time = time.time() - start_time
-            error_message = f"Error executing step {step.id}: {str(e)}"
-            
-            # Create error step result
-            step_result = StepResult(
-                step_id=step.id,
-                result=error_message,
-                execution_time=execution_time,
-                prompt=step_context.get("_current_prompt"),
-                model=step_context.get("_current_model"),
-                temperature=step_context.get("_current_temperature"),
-                system_message=step_context.get("_current_system_message")
-            )
+    layers = _step_layers(workflow.steps) if parallel else [[step] for step in workflow.steps]
+    for layer in layers:
+        if len(layer) == 1:
+            outcomes = [await _execute_workflow_step(layer[0], context, step_executor, on_step_start, on_step_complete)]
+        else:
+            outcomes = await asyncio.gather(*(
+                _execute_workflow_step(step, context, step_executor, on_step_start, on_step_complete)
+                for step in layer
+            ))
+        
+        for step, (step_result, _) in zip(layer, outcomes):
             step_results[step.id] = step_result
             
-            # Notify step completion with error
-            if on_step_complete:
-                on_step_complete(step.id, error_message)
-                
-            # Don't continue execution if a step fails
+        # Don't continue execution if a step fails
+        if not all(succeeded for _, succeeded in outcomes):
             break
     
+    # Layers can run steps out of workflow order; report results in workflow order either way
+    if parallel:
+        step_results = {step.id: step_results[step.id] for step in workflow.steps if step.id in step_results}
+    
     # Calculate total execution time
     total_execution_time = time.time() - workflow_start_time
     
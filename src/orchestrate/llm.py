@@ -44,19 +44,26 @@ class OpenAIClient:
     This class provides a simple interface for making async calls to the OpenAI API.
     """
     
-    def __init__(self, api_key: Optional[str] = None, model: str = DEFAULT_MODEL):
+    def __init__(self, api_key: Optional[str] = None, model: str = DEFAULT_MODEL,
+                 client: Optional[AsyncOpenAI] = None):
         """
         Initialize the LLM client.
         
         Args:
             api_key: OpenAI API key. If not provided, will look for OPENAI_API_KEY environment variable.
             model: The model to use for completions. Defaults to GPT-4o.
+            client: An existing AsyncOpenAI client to send requests through, so several
+                    OpenAIClients can share its connections. If provided, api_key is ignored.
         """
-        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
-        if not self.api_key:
-            raise ValueError("OpenAI API key is required. Provide it as an argument or set OPENAI_API_KEY environment variable.")
-        
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        if client is not None:
+            self.api_key = client.api_key
+            self.client = client
+        else:
+            self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+            if not self.api_key:
+                raise ValueError("OpenAI API key is required. Provide it as an argument or set OPENAI_API_KEY environment variable.")
+            
+            self.client = AsyncOpenAI(api_key=self.api_key)
         self.model = model
     
     async def generate(self, 
@@ -1,6 +1,91 @@
 import asyncio
+import collections
+import functools
+import itertools
+import os
 import random
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable, Iterator
+
+# Prompt keywords that route to each themed response pool, in priority order
+_DOMAIN_KEYWORDS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("debate", ("debate",)),
+    ("dnd", ("dnd", "dungeon")),
+    ("market", ("market",)),
+    ("riddle", ("riddle",)),
+)
+
+# String fields that get a themed response in structured output, per domain
+_STRUCTURED_FIELDS: Dict[str, frozenset] = {
+    "debate": frozenset({"debate_topic", "pro_position", "con_position"}),
+    "dnd": frozenset({"world_setting", "character_details"}),
+    "market": frozenset({"product_name", "key_features", "target_audience"}),
+}
+
+# Mock value generators for non-string schema property types
+_TYPE_GENERATORS: Dict[str, Callable[[], Any]] = {
+    "number": lambda: random.randint(1, 100),
+    "integer": lambda: random.randint(1, 100),
+    "boolean": lambda: random.choice((True, False)),
+    # A list of 2-4 items
+    "array": lambda: [f"Item {i}" for i in range(1, random.randint(2, 5))],
+    # A simple nested object
+    "object": lambda: {"key1": "value1", "key2": "value2"},
+}
+
+# Per-property generation plan for a schema: (property name, type generator or None for strings)
+_SchemaPlan = tuple[tuple[str, Optional[Callable[[], Any]]], ...]
+
+# Number of pre-sampled delays per client; must be a power of two
+_DELAY_POOL_SIZE = 4096
+
+# Canned response pools, built once at import rather than on every call
+_DEBATE_RESPONSES: tuple[str, ...] = (
+    "From a logical perspective, we must consider three key factors...",
+    "The opposing argument fails to account for recent developments in...",
+    "While I understand the counterpoint, the evidence clearly shows...",
+    "This position is supported by multiple peer-reviewed studies that demonstrate...",
+    "The historical precedent for this approach can be traced back to...",
+)
+
+_DND_RESPONSES: tuple[str, ...] = (
+    "The ancient forest of Eldrath stretches before you, its twisted trees reaching toward the darkening sky...",
+    "The dwarf warrior Thorin Stonehammer stands firm, his battleaxe gleaming in the torchlight...",
+    "A mysterious figure emerges from the shadows of the tavern, their face hidden beneath a tattered hood...",
+    "The dragon's roar echoes through the cavern as flames illuminate the treasure hoard...",
+    "The party finds themselves at a crossroads, with an ancient stone marker bearing cryptic runes...",
+)
+
+_MARKETING_RESPONSES: tuple[str, ...] = (
+    "Our revolutionary product combines cutting-edge technology with intuitive design...",
+    "Target audience analysis reveals three key demographics that would benefit from...",
+    "The campaign should focus on the unique value proposition of sustainability and efficiency...",
+    "A multi-channel approach including social media, influencer partnerships, and targeted ads will...",
+    "The brand messaging should emphasize reliability, innovation, and customer-centric values...",
+)
+
+_RIDDLE_RESPONSES: tuple[str, ...] = (
+    "What is always in front of you but can't be seen?",
+    "What has a heart that doesn't beat?",
+    "What is full of holes but still holds water?",
+    "What is always in the middle of you but outside of you?",
+    "What is always in your mouth but never in your stomach?",
+)
+
+_RESPONSE_POOLS: Dict[str, tuple[str, ...]] = {
+    "debate": _DEBATE_RESPONSES,
+    "dnd": _DND_RESPONSES,
+    "market": _MARKETING_RESPONSES,
+    "riddle": _RIDDLE_RESPONSES,
+}
+
+_GENERIC_KEYWORD_TEMPLATE = "Based on your interest in %s, I would recommend exploring this topic further..."
+_GENERIC_FALLBACK_RESPONSE = "I understand your question. Here's a helpful response that addresses your needs..."
+
+def _match_domains(prompt_lower: str) -> Iterator[str]:
+    """Yield the domains whose keywords appear in the lowercased prompt, in priority order."""
+    for domain, keywords in _DOMAIN_KEYWORDS:
+        if any(keyword in prompt_lower for keyword in keywords):
+            yield domain
 
 class MockLLMClient:
     """
@@ -9,14 +94,35 @@ class MockLLMClient:
     This class simulates responses from an LLM with configurable delay and response patterns.
     """
     
-    def __init__(self, delay_range: tuple = (0.5, 2.0)):
+    def __init__(self, delay_range: tuple = (0.5, 2.0), seed: Optional[int] = None):
         """
         Initialize the mock LLM client.
         
         Args:
             delay_range: Tuple of (min_delay, max_delay) in seconds to simulate API latency
+            seed: Optional seed for the delay samples and response order, for reproducible runs
         """
         self.delay_range = delay_range
+        rng = random.Random(seed)
+        # A (0, 0) range skips the sleep entirely rather than yielding to the loop
+        self._zero_delay = delay_range[0] == 0 == delay_range[1]
+        # Pre-sample a ring of delays so each call is an index instead of an RNG draw
+        self._delays = [] if self._zero_delay else [rng.uniform(*delay_range) for _ in range(_DELAY_POOL_SIZE)]
+        self._delay_index = 0
+        # Pre-shuffle each response pool once and serve it round-robin
+        self._pools: Dict[str, collections.deque] = {}
+        for domain, pool in _RESPONSE_POOLS.items():
+            items = list(pool)
+            rng.shuffle(items)
+            self._pools[domain] = collections.deque(items)
+        # Bind the themed response generators once so routing is a single dict lookup
+        self._handlers: Dict[str, Callable[[str], str]] = {
+            "debate": self._generate_debate_response,
+            "dnd": self._generate_dnd_response,
+            "market": self._generate_marketing_response,
+            "riddle": self._generate_riddle_response,
+        }
+        self._default = self._generate_generic_response
         
     async def generate(self, 
                       prompt: str, 
@@ -36,74 +142,75 @@ class MockLLMClient:
             A mock generated text
         """
         # Simulate API delay
-        delay = random.uniform(*self.delay_range)
-        await asyncio.sleep(delay)
+        if not self._zero_delay:
+            await asyncio.sleep(self._next_delay())
         
         # Generate a mock response based on the prompt
-        if "debate" in prompt.lower():
-            return self._generate_debate_response(prompt)
-        elif "dnd" in prompt.lower() or "dungeon" in prompt.lower():
-            return self._generate_dnd_response(prompt)
-        elif "market" in prompt.lower():
-            return self._generate_marketing_response(prompt)
-        elif "riddle" in prompt.lower():
-            return self._generate_riddle_response(prompt)
-        else:
-            return self._generate_generic_response(prompt)
+        domain = next(_match_domains(prompt.lower()), None)
+        return self._handlers.get(domain, self._default)(prompt)
+    
+    def _next_delay(self) -> float:
+        """Return the next pre-sampled delay from the ring."""
+        i = self._delay_index
+        self._delay_index = (i + 1) & (_DELAY_POOL_SIZE - 1)
+        return self._delays[i]
+    
+    @staticmethod
+    def _schema_plan(output_schema: Dict[str, Any]) -> _SchemaPlan:
+        """
+        Get the per-property generation plan for a schema.
+        
+        Each entry pairs a property name with the generator for its type, or None for
+        string properties, which depend on the prompt. Properties of unsupported types
+        are left out.
+        
+        Args:
+            output_schema: JSON schema defining the structure of the expected output
+            
+        Returns:
+            Tuple of (property name, generator or None) in schema order
+        """
+        plan = []
+        for prop_name, prop_schema in output_schema.get('properties', {}).items():
+            prop_type = prop_schema.get('type', 'string')
+            if prop_type == 'string':
+                plan.append((prop_name, None))
+            elif prop_type in _TYPE_GENERATORS:
+                plan.append((prop_name, _TYPE_GENERATORS[prop_type]))
+        return tuple(plan)
+    
+    def _next_response(self, domain: str) -> str:
+        """Return the next response from a domain's pre-shuffled pool."""
+        pool = self._pools[domain]
+        response = pool[0]
+        pool.rotate(-1)
+        return response
     
     def _generate_debate_response(self, prompt: str) -> str:
         """Generate a mock debate response."""
-        debate_responses = [
-            "From a logical perspective, we must consider three key factors...",
-            "The opposing argument fails to account for recent developments in...",
-            "While I understand the counterpoint, the evidence clearly shows...",
-            "This position is supported by multiple peer-reviewed studies that demonstrate...",
-            "The historical precedent for this approach can be traced back to..."
-        ]
-        return random.choice(debate_responses)
+        return self._next_response("debate")
     
     def _generate_dnd_response(self, prompt: str) -> str:
         """Generate a mock D&D response."""
-        dnd_responses = [
-            "The ancient forest of Eldrath stretches before you, its twisted trees reaching toward the darkening sky...",
-            "The dwarf warrior Thorin Stonehammer stands firm, his battleaxe gleaming in the torchlight...",
-            "A mysterious figure emerges from the shadows of the tavern, their face hidden beneath a tattered hood...",
-            "The dragon's roar echoes through the cavern as flames illuminate the treasure hoard...",
-            "The party finds themselves at a crossroads, with an ancient stone marker bearing cryptic runes..."
-        ]
-        return random.choice(dnd_responses)
+        return self._next_response("dnd")
     
     def _generate_marketing_response(self, prompt: str) -> str:
         """Generate a mock marketing response."""
-        marketing_responses = [
-            "Our revolutionary product combines cutting-edge technology with intuitive design...",
-            "Target audience analysis reveals three key demographics that would benefit from...",
-            "The campaign should focus on the unique value proposition of sustainability and efficiency...",
-            "A multi-channel approach including social media, influencer partnerships, and targeted ads will...",
-            "The brand messaging should emphasize reliability, innovation, and customer-centric values..."
-        ]
-        return random.choice(marketing_responses)
+        return self._next_response("market")
     
     def _generate_riddle_response(self, prompt: str) -> str:
         """Generate a mock riddle response."""
-        riddle_responses = [
-            "What is always in front of you but can't be seen?",
-            "What has a heart that doesn't beat?",
-            "What is full of holes but still holds water?",
-            "What is always in the middle of you but outside of you?",
-            "What is always in your mouth but never in your stomach?"
-        ]
-        return random.choice(riddle_responses)
+        return self._next_response("riddle")
     
     def _generate_generic_response(self, prompt: str) -> str:
         """Generate a generic mock response."""
-        # Extract keywords from the prompt
-        keywords = [word for word in prompt.lower().split() if len(word) > 4]
+        # Extract the first few keywords from the prompt, stopping once we have enough
+        keywords = list(itertools.islice((word for word in prompt.split() if len(word) > 4), 3))
         
         if keywords:
-            return f"Based on your interest in {', '.join(keywords[:3])}, I would recommend exploring this topic further..."
+            return _GENERIC_KEYWORD_TEMPLATE % ", ".join(word.lower() for word in keywords)
         else:
-            return "I understand your question. Here's a helpful response that addresses your needs..."
+            return _GENERIC_FALLBACK_RESPONSE
     
     async def generate_structured(self,
                                 prompt: str,
@@ -125,62 +232,141 @@ class MockLLMClient:
             A mock structured output as a dictionary
         """
         # Simulate API delay
-        delay = random.uniform(*self.delay_range)
-        await asyncio.sleep(delay)
+        if not self._zero_delay:
+            await asyncio.sleep(self._next_delay())
         
         # Create a mock structured response based on the schema
         result = {}
         
-        # Extract properties from the schema
-        if 'properties' in output_schema:
-            properties = output_schema['properties']
-            for prop_name, prop_schema in properties.items():
-                # Generate appropriate mock data based on property type
-                prop_type = prop_schema.get('type', 'string')
-                
-                if prop_type == 'string':
-                    if 'debate' in prompt.lower() and prop_name in ['debate_topic', 'pro_position', 'con_position']:
-                        result[prop_name] = self._generate_debate_response(prompt)
-                    elif ('dnd' in prompt.lower() or 'dungeon' in prompt.lower()) and prop_name in ['world_setting', 'character_details']:
-                        result[prop_name] = self._generate_dnd_response(prompt)
-                    elif 'market' in prompt.lower() and prop_name in ['product_name', 'key_features', 'target_audience']:
-                        result[prop_name] = self._generate_marketing_response(prompt)
-                    else:
-                        result[prop_name] = f"Mock {prop_name} response"
-                
-                elif prop_type == 'number' or prop_type == 'integer':
-                    result[prop_name] = random.randint(1, 100)
-                
-                elif prop_type == 'boolean':
-                    result[prop_name] = random.choice([True, False])
-                
-                elif prop_type == 'array':
-                    # Generate a list of 2-4 items
-                    result[prop_name] = [f"Item {i}" for i in range(1, random.randint(2, 5))]
-                
-                elif prop_type == 'object':
-                    # Generate a simple nested object
-                    result[prop_name] = {"key1": "value1", "key2": "value2"}
+        # Work out once which themed pools apply to this prompt, in priority order
+        prompt_lower = prompt.lower()
+        themed = [
+            (_STRUCTURED_FIELDS[domain], self._handlers[domain])
+            for domain in _match_domains(prompt_lower)
+            if domain in _STRUCTURED_FIELDS
+        ]
+        
+        # Generate appropriate mock data for each property, following the schema's type plan
+        for prop_name, type_generator in self._schema_plan(output_schema):
+            if type_generator is not None:
+                result[prop_name] = type_generator()
+                continue
+            for fields, generator in themed:
+                if prop_name in fields:
+                    result[prop_name] = generator(prompt)
+                    break
+            else:
+                result[prop_name] = f"Mock {prop_name} response"
         
         return result
 
-# Singleton instance for convenience
-_mock_client: Optional[MockLLMClient] = None
-
+# One shared instance per delay range for convenience
+@functools.lru_cache(maxsize=None)
 def get_mock_client(delay_range: tuple = (0.5, 2.0)) -> MockLLMClient:
     """
-    Get or create the mock LLM client.
+    Get or create the mock LLM client for the given delay range.
     
     Args:
-        delay_range: Tuple of (min_delay, max_delay) in seconds to simulate API latency
+        delay_range: Tuple of (min_delay, max_delay) in seconds to simulate API latency.
+            Must be hashable; each distinct range gets its own shared client.
         
     Returns:
         MockLLMClient instance
     """
-    global _mock_client
-    if _mock_client is None:
-        _mock_client = MockLLMClient(delay_range=delay_range)
-    return _mock_client
+    return MockLLMClient(delay_range=delay_range)
+
+class _AdmissionController:
+    """
+    Resizable concurrency limiter built on an asyncio.Condition and a counter.
+    
+    Unlike asyncio.Semaphore, the capacity can be changed while requests are in
+    flight: shrinking takes effect as active requests release, growing wakes
+    waiters immediately.
+    """
+    
+    def __init__(self, capacity: int):
+        """
+        Initialize the admission controller.
+        
+        Args:
+            capacity: Maximum number of concurrently admitted requests
+        """
+        self._cap = capacity
+        self._active = 0
+        self._cond = asyncio.Condition(asyncio.Lock())
+    
+    async def acquire(self) -> None:
+        """Wait until a slot is free and claim it."""
+        async with self._cond:
+            while self._active >= self._cap:
+                await self._cond.wait()
+            self._active += 1
+    
+    async def release(self) -> None:
+        """Release a slot and wake one waiter."""
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify(1)
+    
+    async def resize(self, new_cap: int) -> None:
+        """
+        Change the capacity of the controller.
+        
+        Args:
+            new_cap: New maximum number of concurrently admitted requests
+        """
+        async with self._cond:
+            grew = new_cap > self._cap
+            self._cap = new_cap
+            if grew:
+                self._cond.notify_all()
+    
+    async def __aenter__(self) -> '_AdmissionController':
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.release()
+
+# Concurrency gate for generate_mock_completion, created lazily inside the running loop
+_mock_concurrency: int = int(os.getenv("ORCHESTRATE_MOCK_MAX_CONCURRENCY", "64"))
+_gate_controller: Optional[_AdmissionController] = None
+_gate_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def _gate() -> _AdmissionController:
+    """
+    Get the admission controller bounding concurrent mock completions for the running loop.
+    
+    The initial limit is read from the ORCHESTRATE_MOCK_MAX_CONCURRENCY environment
+    variable (default 64) and can be changed with set_mock_concurrency. A new
+    controller is created whenever the running loop changes so it is never
+    shared across event loops.
+    
+    Returns:
+        _AdmissionController instance
+    """
+    global _gate_controller, _gate_loop
+    loop = asyncio.get_running_loop()
+    if _gate_controller is None or _gate_loop is not loop:
+        _gate_controller = _AdmissionController(_mock_concurrency)
+        _gate_loop = loop
+    return _gate_controller
+
+async def set_mock_concurrency(n: int) -> None:
+    """
+    Change the maximum number of concurrent mock completions.
+    
+    Safe to call while completions are in flight; waiters are admitted as soon
+    as the new limit allows.
+    
+    Args:
+        n: Maximum number of concurrent completions
+    """
+    global _mock_concurrency
+    if n < 1:
+        raise ValueError("Mock concurrency must be at least 1")
+    _mock_concurrency = n
+    await _gate().resize(n)
 
 async def generate_mock_completion(prompt: str, temperature: float = 0.7, max_tokens: int = 1000) -> str:
     """
@@ -195,4 +381,6 @@ async def generate_mock_completion(prompt: str, temperature: float = 0.7, max_to
         A mock generated text
     """
     client = get_mock_client()
-    return await client.generate(prompt, temperature, max_tokens) 
\ No newline at end of file
+    async with _gate():
+        return await client.generate(prompt, temperature, max_tokens)
+ 
\ No newline at end of file
@@ -1,5 +1,5 @@
 from typing import List, Dict, Any, Optional, Union
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 class StepIO(BaseModel):
     """
@@ -9,7 +9,11 @@ class StepIO(BaseModel):
         name: Name of the input/output
         source: Source of the input (step_id or 'user' for inputs, None for outputs)
         description: Optional description
+    
+    Instances are immutable so that identical specifications can be shared.
     """
+    model_config = ConfigDict(frozen=True)
+    
     name: str
     source: Optional[str] = None
     description: str = ""
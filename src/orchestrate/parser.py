@@ -1,9 +1,30 @@
+import functools
+import os
+import stat
+import sys
+import uuid
 import yaml
-from typing import Dict, Any, Optional, List
+from collections.abc import Hashable
+from typing import Dict, Any, Optional, List, Iterator, Tuple
 from pathlib import Path
 
 from .models import Workflow, WorkflowStep, StepIO
 
+# Prefer the libyaml C bindings, falling back to the pure-Python implementation
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
+def _intern(value: Any) -> Any:
+    """Intern string values so repeated step ids and names share one object."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+@functools.lru_cache(maxsize=1024)
+def _make_stepio(name: str, source: Optional[str], description: str) -> StepIO:
+    """Build a StepIO, reusing the shared instance for repeated specifications."""
+    return StepIO(name=name, source=source, description=description)
+
 def parse_step_io(io_data: List[Dict[str, Any]]) -> List[StepIO]:
     """
     Parse input or output specifications from YAML data.
@@ -24,21 +45,192 @@ def parse_step_io(io_data: List[Dict[str, Any]]) -> List[StepIO]:
         if not name:
             continue
             
-        source = item.get("source")
+        source = _intern(item.get("source"))
         description = item.get("description", "")
-        
-        result.append(StepIO(
-            name=name,
-            source=source,
-            description=description
-        ))
+        try:
+            result.append(_make_stepio(_intern(name), source, description))
+        except TypeError:
+            # Unhashable values can't be cached; let pydantic report the invalid field
+            result.append(StepIO(name=name, source=source, description=description))
         
     return result
 
+_REQUIRED_STEP_FIELDS = frozenset({"id", "prompt"})
+
+_MERGE_TAG = "tag:yaml.org,2002:merge"
+_MAP_TAG = "tag:yaml.org,2002:map"
+_SEQ_TAG = "tag:yaml.org,2002:seq"
+
+def _compose_node(loader: _Loader, anchors: Dict[str, yaml.Node]) -> yaml.Node:
+    """
+    Compose the next complete YAML node from the loader's event stream.
+    
+    Mirrors PyYAML's composer, so nodes are tagged exactly as yaml.safe_load
+    would tag them.
+    
+    Args:
+        loader: Loader positioned at the start of a node
+        anchors: Nodes composed so far, keyed by anchor name
+        
+    Returns:
+        The composed node
+    """
+    event = loader.get_event()
+    
+    if isinstance(event, yaml.AliasEvent):
+        if event.anchor not in anchors:
+            raise yaml.composer.ComposerError(None, None, f"found undefined alias {event.anchor!r}", event.start_mark)
+        return anchors[event.anchor]
+    
+    if event.anchor is not None and event.anchor in anchors:
+        raise yaml.composer.ComposerError(
+            f"found duplicate anchor {event.anchor!r}; first occurrence", anchors[event.anchor].start_mark,
+            "second occurrence", event.start_mark
+        )
+    
+    tag = event.tag
+    if isinstance(event, yaml.ScalarEvent):
+        if tag is None or tag == "!":
+            tag = loader.resolve(yaml.ScalarNode, event.value, event.implicit)
+        node = yaml.ScalarNode(tag, event.value, event.start_mark, event.end_mark, style=event.style)
+        if event.anchor is not None:
+            anchors[event.anchor] = node
+    
+    elif isinstance(event, yaml.SequenceStartEvent):
+        if tag is None or tag == "!":
+            tag = loader.resolve(yaml.SequenceNode, None, event.implicit)
+        node = yaml.SequenceNode(tag, [], event.start_mark, None, flow_style=event.flow_style)
+        if event.anchor is not None:
+            anchors[event.anchor] = node
+        while not loader.check_event(yaml.SequenceEndEvent):
+            node.value.append(_compose_node(loader, anchors))
+        node.end_mark = loader.get_event().end_mark
+    
+    elif isinstance(event, yaml.MappingStartEvent):
+        if tag is None or tag == "!":
+            tag = loader.resolve(yaml.MappingNode, None, event.implicit)
+        node = yaml.MappingNode(tag, [], event.start_mark, None, flow_style=event.flow_style)
+        if event.anchor is not None:
+            anchors[event.anchor] = node
+        while not loader.check_event(yaml.MappingEndEvent):
+            key_node = _compose_node(loader, anchors)
+            node.value.append((key_node, _compose_node(loader, anchors)))
+        node.end_mark = loader.get_event().end_mark
+    
+    else:
+        raise yaml.composer.ComposerError(None, None, f"unexpected {type(event).__name__}", event.start_mark)
+    
+    return node
+
+def _construct_node(loader: _Loader, node: yaml.Node) -> Any:
+    """
+    Construct a Python value from a composed node with the loader's constructors.
+    
+    Tags, merge keys and errors therefore behave exactly as with yaml.safe_load.
+    
+    Args:
+        loader: Loader the node was composed from
+        node: Node to construct
+        
+    Returns:
+        The constructed Python value
+    """
+    try:
+        return loader.construct_object(node, deep=True)
+    finally:
+        loader.constructed_objects = {}
+        loader.recursive_objects = {}
+
+def _construct_value(loader: _Loader, anchors: Dict[str, yaml.Node]) -> Any:
+    """
+    Compose and construct the next complete YAML node from the loader's event stream.
+    
+    Args:
+        loader: Loader positioned at the start of a node
+        anchors: Nodes composed so far, keyed by anchor name
+        
+    Returns:
+        The constructed Python value
+    """
+    return _construct_node(loader, _compose_node(loader, anchors))
+
+def _build_step(index: int, step_data: Any) -> WorkflowStep:
+    """
+    Validate a single step's YAML data and convert it into a WorkflowStep.
+    
+    Args:
+        index: Position of the step in the workflow
+        step_data: The step's YAML data
+        
+    Returns:
+        WorkflowStep object
+        
+    Raises:
+        ValueError: If the step is not a dictionary or is missing required fields
+    """
+    if not isinstance(step_data, dict):
+        raise ValueError(f"Step {index} must be a dictionary")
+    
+    # One set difference covers both required fields on the common, valid path
+    missing = _REQUIRED_STEP_FIELDS - step_data.keys()
+    if missing:
+        if "id" in missing:
+            raise ValueError(f"Step {index} must have an id")
+        raise ValueError(f"Step {index} must have a prompt")
+    
+    # Parse inputs and outputs
+    inputs = step_data.get("inputs")
+    outputs = step_data.get("outputs")
+    
+    # Create step with inputs and outputs
+    return WorkflowStep(
+        id=_intern(step_data["id"]),
+        prompt=step_data["prompt"],
+        inputs=parse_step_io(inputs) if isinstance(inputs, list) else [],
+        outputs=parse_step_io(outputs) if isinstance(outputs, list) else []
+    )
+
+def _iter_steps(loader: _Loader, anchors: Dict[str, yaml.Node]) -> Iterator[WorkflowStep]:
+    """
+    Stream the steps sequence, yielding each WorkflowStep as its mapping closes.
+    
+    Only one step's raw YAML data is alive at a time.
+    
+    Args:
+        loader: Loader positioned at the start of the steps sequence
+        anchors: Nodes composed so far, keyed by anchor name
+        
+    Yields:
+        WorkflowStep objects in document order
+    """
+    loader.get_event()
+    index = 0
+    while not loader.check_event(yaml.SequenceEndEvent):
+        yield _build_step(index, _construct_value(loader, anchors))
+        index += 1
+    loader.get_event()
+
+def _is_streamable_sequence(loader: _Loader) -> bool:
+    """Whether the next node is a plain, unanchored sequence that can be streamed."""
+    if not loader.check_event(yaml.SequenceStartEvent):
+        return False
+    event = loader.peek_event()
+    return event.anchor is None and event.tag in (None, "!", _SEQ_TAG)
+
+def _build_steps(value: Any) -> Optional[List[WorkflowStep]]:
+    """Convert a constructed steps value into WorkflowSteps, or None if it isn't a list."""
+    if not isinstance(value, list):
+        return None
+    return [_build_step(index, step_data) for index, step_data in enumerate(value)]
+
 def load_workflow_from_yaml(yaml_content: str) -> Workflow:
     """
     Parse YAML content into a Workflow object.
     
+    The document is consumed as a stream of YAML events and each step is
+    converted as soon as it has been read, rather than building the whole
+    document as a dictionary first.
+    
     Args:
         yaml_content: String containing YAML workflow definition
         
@@ -48,17 +240,63 @@ def load_workflow_from_yaml(yaml_content: str) -> Workflow:
     Raises:
         ValueError: If the YAML content is invalid or missing required fields
     """
+    loader = _Loader(yaml_content)
     try:
-        data = yaml.safe_load(yaml_content)
+        anchors: Dict[str, yaml.Node] = {}
+        loader.get_event()
         
         # Validate required fields
-        if not isinstance(data, dict):
+        if loader.check_event(yaml.StreamEndEvent):
             raise ValueError("YAML content must be a dictionary")
+        loader.get_event()
+        if not loader.check_event(yaml.MappingStartEvent) or loader.peek_event().tag not in (None, "!", _MAP_TAG):
+            raise ValueError("YAML content must be a dictionary")
+        loader.get_event()
+        
+        data: Dict[str, Any] = {}
+        steps: Optional[List[WorkflowStep]] = None
+        merge_pairs = []
+        while not loader.check_event(yaml.MappingEndEvent):
+            key_node = _compose_node(loader, anchors)
+            if key_node.tag == _MERGE_TAG:
+                merge_pairs.append((key_node, _compose_node(loader, anchors)))
+                continue
+            key = _construct_node(loader, key_node)
+            if not isinstance(key, Hashable):
+                raise yaml.constructor.ConstructorError(
+                    "while constructing a mapping", None, "found unhashable key", key_node.start_mark
+                )
+            if key == "steps" and _is_streamable_sequence(loader):
+                steps = list(_iter_steps(loader, anchors))
+                data[key] = steps
+            else:
+                value = _construct_value(loader, anchors)
+                data[key] = value
+                if key == "steps":
+                    steps = _build_steps(value)
+        loader.get_event()
+        loader.get_event()
+        
+        if not loader.check_event(yaml.StreamEndEvent):
+            event = loader.get_event()
+            raise yaml.composer.ComposerError(
+                "expected a single document in the stream", None,
+                "but found another document", event.start_mark
+            )
+        
+        # Merged keys never override keys set explicitly on the mapping
+        if merge_pairs:
+            merged = _construct_node(loader, yaml.MappingNode(_MAP_TAG, merge_pairs))
+            for merged_key, merged_value in merged.items():
+                if merged_key not in data:
+                    data[merged_key] = merged_value
+                    if merged_key == "steps":
+                        steps = _build_steps(merged_value)
         
         if "name" not in data:
             raise ValueError("Workflow must have a name")
             
-        if "steps" not in data or not isinstance(data["steps"], list):
+        if steps is None:
             raise ValueError("Workflow must have a list of steps")
         
         # Extract workflow metadata
@@ -66,50 +304,24 @@ def load_workflow_from_yaml(yaml_content: str) -> Workflow:
         description = data.get("description", "")
         version = data.get("version", "")
         
-        # Parse steps
-        steps_data = data.get("steps", [])
-        steps = []
-        
-        for i, step_data in enumerate(steps_data):
-            if not isinstance(step_data, dict):
-                raise ValueError(f"Step {i} must be a dictionary")
-                
-            if "id" not in step_data:
-                raise ValueError(f"Step {i} must have an id")
-                
-            if "prompt" not in step_data:
-                raise ValueError(f"Step {i} must have a prompt")
-            
-            # Parse inputs and outputs
-            inputs = []
-            outputs = []
-            
-            if "inputs" in step_data and isinstance(step_data["inputs"], list):
-                inputs = parse_step_io(step_data["inputs"])
-                
-            if "outputs" in step_data and isinstance(step_data["outputs"], list):
-                outputs = parse_step_io(step_data["outputs"])
-            
-            # Create step with inputs and outputs
-            step = WorkflowStep(
-                id=step_data["id"],
-                prompt=step_data["prompt"],
-                inputs=inputs,
-                outputs=outputs
-            )
-            
-            steps.append(step)
-        
         return Workflow(name=name, description=description, version=version, steps=steps)
     except yaml.YAMLError as e:
         raise ValueError(f"Failed to parse YAML: {str(e)}")
     except Exception as e:
         raise ValueError(f"Failed to parse workflow: {str(e)}")
+    finally:
+        loader.dispose()
+
+# Workflows loaded from files, by absolute path, with the file content they were parsed from
+_WORKFLOW_FILE_CACHE: Dict[str, Tuple[str, Workflow]] = {}
 
 def load_workflow_from_file(file_path: str) -> Workflow:
     """
     Load workflow from a YAML file.
     
+    The file is only parsed again once its content changes. Each call returns
+    its own copy of the workflow, so callers are free to modify it.
+    
     Args:
         file_path: Path to the YAML file
         
@@ -120,14 +332,16 @@ def load_workflow_from_file(file_path: str) -> Workflow:
         FileNotFoundError: If the file does not exist
         ValueError: If the file content is invalid
     """
-    path = Path(file_path)
-    if not path.exists():
+    try:
+        yaml_content = Path(file_path).read_text(encoding="utf-8")
+    except FileNotFoundError:
         raise FileNotFoundError(f"File not found: {file_path}")
-        
-    with open(file_path, "r") as f:
-        yaml_content = f.read()
-        
-    return load_workflow_from_yaml(yaml_content)
+    
+    key = os.path.abspath(file_path)
+    cached = _WORKFLOW_FILE_CACHE.get(key)
+    if cached is None or cached[0] != yaml_content:
+        cached = _WORKFLOW_FILE_CACHE[key] = (yaml_content, load_workflow_from_yaml(yaml_content))
+    return cached[1].model_copy(deep=True)
 
 def workflow_to_yaml(workflow: Workflow) -> str:
     """
@@ -140,4 +354,48 @@ def workflow_to_yaml(workflow: Workflow) -> str:
         YAML string representation of the workflow
     """
     workflow_dict = workflow.model_dump()
-    return yaml.dump(workflow_dict, sort_keys=False) 
\ No newline at end of file
+    return yaml.dump(workflow_dict, Dumper=_Dumper, sort_keys=False)
+
+def save_workflow_to_file(workflow: Workflow, file_path: str) -> None:
+    """
+    Write a Workflow object to a YAML file.
+    
+    The YAML is emitted straight to a temporary file next to the target rather
+    than built as a string first, so large workflows are never held in memory
+    twice. The temporary file then replaces the target, so a failed save leaves
+    any existing file untouched.
+    
+    Args:
+        workflow: Workflow object to save
+        file_path: Path to the YAML file
+    """
+    tmp_path = f"{file_path}.{uuid.uuid4().hex}.tmp"
+    # Created like open(..., "w") would, so the usual umask applies
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with open(fd, "w", encoding="utf-8") as f:
+            yaml.dump(workflow.model_dump(), f, Dumper=_Dumper, sort_keys=False)
+        # Keep the permissions of the file being replaced
+        try:
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(file_path).st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def workflow_to_json(workflow: Workflow) -> str:
+    """
+    Convert a Workflow object to a JSON string.
+    
+    Serialization is done in a single pass by pydantic's compiled serializer,
+    for callers that don't need YAML specifically.
+    
+    Args:
+        workflow: Workflow object to convert
+        
+    Returns:
+        JSON string representation of the workflow
+    """
+    return workflow.model_dump_json()
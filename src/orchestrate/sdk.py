@@ -5,84 +5,114 @@ This module provides a fluent API for creating, modifying, and executing workflo
 in code, as an alternative to the YAML-based approach.
 """
 
-from typing import List, Dict, Any, Optional, Union, TypeVar, Generic, Callable, Type, cast, overload
+from typing import List, Dict, Optional, Tuple
 from contextlib import contextmanager
-import yaml
-from pathlib import Path
-import textwrap
+from dataclasses import dataclass, field
+import os
+import sys
 
 from .models import Workflow as WorkflowModel
 from .models import WorkflowStep as WorkflowStepModel
 from .models import StepIO as StepIOModel
-from .parser import workflow_to_yaml, load_workflow_from_yaml, load_workflow_from_file
 
-# Type variables for generic typing
-T = TypeVar('T')
-OutputT = TypeVar('OutputT')
+# The parser, and PyYAML with it, is only imported once a workflow is
+# serialized or loaded, so building workflows in memory doesn't pay for it
 
+def _clean_prompt(text: str) -> str:
+    """
+    Clean up prompt text by removing extra whitespace and newlines.
+    
+    Equivalent to textwrap.dedent(text).strip(), but finds the common margin
+    and rebuilds the text in a single pass over the lines.
+    """
+    lines = text.split("\n")
+    margin = None
+    for line in lines:
+        content = line.lstrip(" \t")
+        if not content:
+            continue
+        indent = line[:len(line) - len(content)]
+        if margin is None:
+            margin = indent
+        elif not indent.startswith(margin):
+            margin = os.path.commonprefix((margin, indent))
+            if not margin:
+                break
+    cut = len(margin) if margin else 0
+    # Whitespace-only lines collapse to empty lines, as with textwrap.dedent
+    return "\n".join(line[cut:] if line.lstrip(" \t") else "" for line in lines).strip()
+
+# Steps store each input and output compactly as (name, source, description);
+# outputs always have a source of None
+_IOSpec = Tuple[str, Optional[str], str]
+
+def _io_model(spec: _IOSpec) -> StepIOModel:
+    """Build the StepIO model for a stored input or output specification."""
+    name, source, description = spec
+    return StepIOModel.model_construct(name=name, source=source, description=description)
 
+
+@dataclass(slots=True, eq=False)
 class Input:
-    """Builder class for step inputs."""
+    """
+    Builder class for step inputs.
     
-    def __init__(self, name: str, source: Optional[str] = None, description: str = ""):
-        """
-        Initialize an input specification.
-        
-        Args:
-            name: Name of the input
-            source: Source of the input (step_id or 'user')
-            description: Optional description
-        """
-        self.name = name
-        self.source = source
-        self.description = description
+    Attributes:
+        name: Name of the input
+        source: Source of the input (step_id or 'user')
+        description: Optional description
+    """
+    name: str
+    source: Optional[str] = None
+    description: str = ""
     
     def to_model(self) -> StepIOModel:
         """Convert to StepIO model."""
-        return StepIOModel(
+        return StepIOModel.model_construct(
             name=self.name,
             source=self.source,
             description=self.description
         )
 
 
+@dataclass(slots=True, eq=False)
 class Output:
-    """Builder class for step outputs."""
+    """
+    Builder class for step outputs.
     
-    def __init__(self, name: str, description: str = ""):
-        """
-        Initialize an output specification.
-        
-        Args:
-            name: Name of the output
-            description: Optional description
-        """
-        self.name = name
-        self.description = description
+    Attributes:
+        name: Name of the output
+        description: Optional description
+    """
+    name: str
+    description: str = ""
     
     def to_model(self) -> StepIOModel:
         """Convert to StepIO model."""
-        return StepIOModel(
+        return StepIOModel.model_construct(
             name=self.name,
+            source=None,
             description=self.description
         )
 
 
+# Steps are mutable builders, so they keep identity equality and stay hashable
+@dataclass(slots=True, eq=False)
 class Step:
-    """Builder class for workflow steps with a fluent interface."""
+    """
+    Builder class for workflow steps with a fluent interface.
     
-    def __init__(self, id: str):
-        """
-        Initialize a step builder.
-        
-        Args:
-            id: Unique identifier for the step
-        """
-        self.id = id
-        self._prompt = ""
-        self._inputs: List[Input] = []
-        self._outputs: List[Output] = []
-        self._parent_workflow: Optional['Workflow'] = None
+    Attributes:
+        id: Unique identifier for the step
+    """
+    id: str
+    _prompt: str = field(default="", init=False)
+    _inputs: List[_IOSpec] = field(default_factory=list, init=False)
+    _outputs: List[_IOSpec] = field(default_factory=list, init=False)
+    _parent_workflow: Optional['Workflow'] = field(default=None, init=False, repr=False)
+    # Cached result of to_model, rebuilt only after a change
+    _dirty: bool = field(default=True, init=False, repr=False)
+    _model_cache: Optional[WorkflowStepModel] = field(default=None, init=False, repr=False)
     
     def prompt(self, text: str) -> 'Step':
         """
@@ -94,8 +124,8 @@ class Step:
         Returns:
             Self for method chaining
         """
-        # Clean up the prompt text by removing extra whitespace and newlines
-        self._prompt = textwrap.dedent(text).strip()
+        self._prompt = _clean_prompt(text)
+        self._dirty = True
         return self
     
     def add_input(self, name: str, source: Optional[str] = None, description: str = "") -> 'Step':
@@ -110,7 +140,8 @@ class Step:
         Returns:
             Self for method chaining
         """
-        self._inputs.append(Input(name=name, source=source, description=description))
+        self._inputs.append((name, source, description))
+        self._dirty = True
         return self
     
     def add_output(self, name: str, description: str = "") -> 'Step':
@@ -124,17 +155,28 @@ class Step:
         Returns:
             Self for method chaining
         """
-        self._outputs.append(Output(name=name, description=description))
+        self._outputs.append((name, None, description))
+        self._dirty = True
         return self
     
     def to_model(self) -> WorkflowStepModel:
-        """Convert to WorkflowStep model."""
-        return WorkflowStepModel(
-            id=self.id,
-            prompt=self._prompt,
-            inputs=[input.to_model() for input in self._inputs],
-            outputs=[output.to_model() for output in self._outputs]
-        )
+        """
+        Convert to WorkflowStep model.
+        
+        The model is cached until the step changes, so the returned instance
+        is shared and should not be mutated. Models are built without pydantic
+        validation since the builder methods already fix their types.
+        """
+        cached = self._model_cache
+        if self._dirty or cached is None or cached.id != self.id:
+            cached = self._model_cache = WorkflowStepModel.model_construct(
+                id=self.id,
+                prompt=self._prompt,
+                inputs=[_io_model(spec) for spec in self._inputs],
+                outputs=[_io_model(spec) for spec in self._outputs]
+            )
+            self._dirty = False
+        return cached
     
     def __enter__(self) -> 'Step':
         """Context manager entry."""
@@ -160,6 +202,12 @@ class Workflow:
         self._description = ""
         self._version = ""
         self._steps: List[Step] = []
+        # Steps already added, by id, for constant-time membership checks
+        self._step_ids: Dict[str, Step] = {}
+        # Cached results of to_model and to_yaml, rebuilt only after a change
+        self._dirty = True
+        self._model_cache: Optional[WorkflowModel] = None
+        self._yaml_cache: Optional[tuple] = None
     
     def description(self, text: str) -> 'Workflow':
         """
@@ -172,6 +220,7 @@ class Workflow:
             Self for method chaining
         """
         self._description = text
+        self._dirty = True
         return self
     
     def version(self, version: str) -> 'Workflow':
@@ -185,19 +234,25 @@ class Workflow:
             Self for method chaining
         """
         self._version = version
+        self._dirty = True
         return self
     
     def add_step(self, step: Step) -> 'Workflow':
         """
         Add a step to this workflow.
         
+        Adding a step that is already part of this workflow is a no-op.
+        
         Args:
             step: The step to add
             
         Returns:
             Self for method chaining
         """
-        self._steps.append(step)
+        if self._step_ids.get(step.id) is not step:
+            self._steps.append(step)
+            self._step_ids[step.id] = step
+            self._dirty = True
         return self
     
     def add_steps(self, steps: List[Step]) -> 'Workflow':
@@ -210,17 +265,32 @@ class Workflow:
         Returns:
             Self for method chaining
         """
-        self._steps.extend(steps)
+        for step in steps:
+            self.add_step(step)
         return self
     
     def to_model(self) -> WorkflowModel:
-        """Convert to Workflow model."""
-        return WorkflowModel(
-            name=self.name,
-            description=self._description,
-            version=self._version,
-            steps=[step.to_model() for step in self._steps]
-        )
+        """
+        Convert to Workflow model.
+        
+        The model is cached until the workflow or any of its steps changes, so
+        the returned instance is shared and should not be mutated. Models are
+        built without pydantic validation since the builder methods already fix
+        their types.
+        """
+        step_models = [step.to_model() for step in self._steps]
+        cached = self._model_cache
+        if (self._dirty or cached is None or cached.name != self.name
+                or len(cached.steps) != len(step_models)
+                or any(cached_step is not step_model for cached_step, step_model in zip(cached.steps, step_models))):
+            cached = self._model_cache = WorkflowModel.model_construct(
+                name=self.name,
+                description=self._description,
+                version=self._version,
+                steps=step_models
+            )
+            self._dirty = False
+        return cached
     
     def to_yaml(self) -> str:
         """
@@ -229,7 +299,12 @@ class Workflow:
         Returns:
             YAML string representation of the workflow
         """
-        return workflow_to_yaml(self.to_model())
+        from .parser import workflow_to_yaml
+        
+        model = self.to_model()
+        if self._yaml_cache is None or self._yaml_cache[0] is not model:
+            self._yaml_cache = (model, workflow_to_yaml(model))
+        return self._yaml_cache[1]
     
     def save(self, file_path: str) -> None:
         """
@@ -238,8 +313,8 @@ class Workflow:
         Args:
             file_path: Path to save the file
         """
-        with open(file_path, 'w') as f:
-            f.write(self.to_yaml())
+        from .parser import save_workflow_to_file
+        save_workflow_to_file(self.to_model(), file_path)
     
     @classmethod
     def from_yaml(cls, yaml_content: str) -> 'Workflow':
@@ -252,6 +327,7 @@ class Workflow:
         Returns:
             Workflow instance
         """
+        from .parser import load_workflow_from_yaml
         model = load_workflow_from_yaml(yaml_content)
         return cls._from_model(model)
     
@@ -266,6 +342,7 @@ class Workflow:
         Returns:
             Workflow instance
         """
+        from .parser import load_workflow_from_file
         model = load_workflow_from_file(file_path)
         return cls._from_model(model)
     
@@ -281,27 +358,56 @@ class Workflow:
             Workflow instance
         """
         workflow = cls(model.name)
-        workflow.description(model.description)
-        workflow.version(model.version)
+        workflow._description = model.description
+        workflow._version = model.version
         
+        # Names and sources repeat across steps, so builders share interned strings,
+        # and identical I/O specifications share one (frozen) StepIO model
+        intern = sys.intern
+        io_cache: Dict[tuple, StepIOModel] = {}
+        
+        # Fill the builders directly and seed their to_model caches with new
+        # step and workflow models, so nothing mutable is shared with the loaded
+        # model; only the frozen StepIO models are reused
         for step_model in model.steps:
-            step = Step(step_model.id)
-            step.prompt(step_model.prompt)
-            
-            for input_model in step_model.inputs:
-                step.add_input(
-                    name=input_model.name,
-                    source=input_model.source,
-                    description=input_model.description
+            step = Step(intern(step_model.id))
+            step._prompt = _clean_prompt(step_model.prompt)
+            step._inputs = [
+                (
+                    intern(input_model.name),
+                    intern(input_model.source) if input_model.source is not None else None,
+                    input_model.description
                 )
+                for input_model in step_model.inputs
+            ]
+            step._outputs = [
+                (intern(output_model.name), None, output_model.description)
+                for output_model in step_model.outputs
+            ]
             
-            for output_model in step_model.outputs:
-                step.add_output(
-                    name=output_model.name,
-                    description=output_model.description
-                )
-            
-            workflow.add_step(step)
+            step._model_cache = WorkflowStepModel.model_construct(
+                id=step.id,
+                prompt=step._prompt,
+                inputs=[
+                    io_cache.setdefault(spec, input_model)
+                    for spec, input_model in zip(step._inputs, step_model.inputs)
+                ],
+                outputs=[
+                    io_cache.setdefault(spec, output_model if output_model.source is None else _io_model(spec))
+                    for spec, output_model in zip(step._outputs, step_model.outputs)
+                ]
+            )
+            step._dirty = False
+            workflow._steps.append(step)
+            workflow._step_ids[step.id] = step
+        
+        workflow._model_cache = WorkflowModel.model_construct(
+            name=model.name,
+            description=model.description,
+            version=model.version,
+            steps=[step._model_cache for step in workflow._steps]
+        )
+        workflow._dirty = False
         
         return workflow
     
@@ -329,5 +435,5 @@ class Workflow:
         try:
             yield step
         finally:
-            if step not in self._steps:
+            if self._step_ids.get(step.id) is not step:
                 self.add_step(step) 
\ No newline at end of file
@@ -2,26 +2,55 @@ import json
 import sys
 import os
 from typing import Dict, Any, Optional, List
-import argparse
-from pathlib import Path
 import textwrap
-from datetime import datetime
+import functools
 
-from .models import WorkflowResult, StepResult, Workflow, WorkflowStep
-from .parser import load_workflow_from_file
+from .models import WorkflowResult, StepResult, Workflow
+
+# Use orjson for reading result files and formatting results when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# ANSI color codes are only emitted when writing to a terminal and NO_COLOR is unset
+_USE_COLOR = sys.stdout is not None and sys.stdout.isatty() and not os.environ.get("NO_COLOR")
+
+def _color(code: str) -> str:
+    """Return the ANSI code if colors are enabled, otherwise an empty string."""
+    return code if _USE_COLOR else ""
 
 # ANSI color codes for terminal output
-COLORS = {
-    "HEADER": "\033[95m",
-    "BLUE": "\033[94m",
-    "CYAN": "\033[96m",
-    "GREEN": "\033[92m",
-    "YELLOW": "\033[93m",
-    "RED": "\033[91m",
-    "ENDC": "\033[0m",
-    "BOLD": "\033[1m",
-    "UNDERLINE": "\033[4m"
-}
+HEADER = _color("\033[95m")
+BLUE = _color("\033[94m")
+CYAN = _color("\033[96m")
+GREEN = _color("\033[92m")
+YELLOW = _color("\033[93m")
+RED = _color("\033[91m")
+ENDC = _color("\033[0m")
+BOLD = _color("\033[1m")
+UNDERLINE = _color("\033[4m")
+
+# Amount of buffered report text written to stdout at a time
+_FLUSH_THRESHOLD = 64 * 1024
+
+# Pre-rendered colored line templates, filled in with str.format
+_STEP_HEADER = f"{BOLD}{BLUE}Step: {{}}{ENDC}\n"
+_EXECUTION_TIME = f"{CYAN}Execution Time: {{}}{ENDC}\n"
+_PROMPT_HEADER = f"\n{YELLOW}Prompt:{ENDC}\n"
+_RESULT_HEADER = f"\n{GREEN}Result:{ENDC}\n"
+_OUTPUTS_HEADER = f"\n{YELLOW}Outputs:{ENDC}\n"
+_OUTPUT_NAME = f"  {BOLD}{{}}:{ENDC}\n"
+# Truncated output rows are joined from these around the name and value
+_OUTPUT_ROW_PREFIX = f"  {BOLD}"
+_OUTPUT_ROW_SEPARATOR = f":{ENDC} "
+_MODEL = f"\n{CYAN}Model: {{}}{ENDC}\n"
+_TEMPERATURE = f"{CYAN}Temperature: {{}}{ENDC}\n"
+_WORKFLOW_HEADER = f"{BOLD}{HEADER}Workflow: {{}}{ENDC}\n"
+_TOTAL_EXECUTION_TIME = f"{CYAN}Total Execution Time: {{}}{ENDC}\n"
+_STEP_COUNT = f"{CYAN}Steps: {{}}{ENDC}\n"
 
 def format_time(seconds: float) -> str:
     """Format time in seconds to a human-readable string."""
@@ -44,67 +73,99 @@ def truncate_text(text: str, max_length: int = 100, add_ellipsis: bool = True) -
         return text
     return text[:max_length] + ("..." if add_ellipsis else "")
 
+# Shared TextWrapper instances keyed by (width, initial_indent, subsequent_indent)
+_WRAPPER_CACHE: Dict[tuple, textwrap.TextWrapper] = {}
+
 def wrap_text(text: str, width: int = 80, initial_indent: str = "", subsequent_indent: str = "") -> str:
     """Wrap text to a specified width."""
-    return textwrap.fill(
-        text, 
-        width=width, 
-        initial_indent=initial_indent, 
-        subsequent_indent=subsequent_indent
-    )
+    key = (width, initial_indent, subsequent_indent)
+    wrapper = _WRAPPER_CACHE.get(key)
+    if wrapper is None:
+        wrapper = _WRAPPER_CACHE[key] = textwrap.TextWrapper(
+            width=width,
+            initial_indent=initial_indent,
+            subsequent_indent=subsequent_indent
+        )
+    return wrapper.fill(text)
+
+def _format_dict_json(data: Dict[str, Any]) -> str:
+    """Format a dict as indented JSON, using orjson when it can encode the data."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass
+    # orjson writes non-ASCII text as-is, so the fallback must not escape it either
+    return json.dumps(data, indent=2, ensure_ascii=False)
 
+@functools.singledispatch
 def format_result(result: Any, max_length: int = 1000) -> str:
     """Format a result based on its type."""
-    if isinstance(result, dict):
-        # Format as JSON
-        formatted = format_json(result)
-        if len(formatted) > max_length:
-            formatted = formatted[:max_length] + "..."
-        return formatted
-    elif isinstance(result, str):
-        # Format as text
-        if len(result) > max_length:
-            return truncate_text(result, max_length)
-        return result
-    else:
-        # Convert to string and format
-        return truncate_text(str(result), max_length)
+    # Convert to string and format
+    return truncate_text(str(result), max_length)
+
+@format_result.register
+def _(result: dict, max_length: int = 1000) -> str:
+    # Format as JSON
+    formatted = _format_dict_json(result)
+    if len(formatted) > max_length:
+        formatted = formatted[:max_length] + "..."
+    return formatted
+
+@format_result.register
+def _(result: str, max_length: int = 1000) -> str:
+    # Format as text
+    return truncate_text(result, max_length)
 
 def print_step_result(step_id: str, step_result: StepResult, verbose: bool = False, 
                       show_prompt: bool = False, show_full_result: bool = False, 
-                      show_full_outputs: bool = False, width: int = 80) -> None:
-    """Print a formatted step result to the console."""
-    print(f"{COLORS['BOLD']}{COLORS['BLUE']}Step: {step_id}{COLORS['ENDC']}")
-    print(f"{COLORS['CYAN']}Execution Time: {format_time(step_result.execution_time)}{COLORS['ENDC']}")
+                      show_full_outputs: bool = False, width: int = 80,
+                      out: Optional[List[str]] = None) -> None:
+    """
+    Print a formatted step result to the console.
+    
+    If out is given, the text is appended to it instead of being written to
+    stdout, so callers can batch several steps into a single write.
+    """
+    parts = [] if out is None else out
+    emit = parts.append
+    
+    emit(_STEP_HEADER.format(step_id))
+    emit(_EXECUTION_TIME.format(format_time(step_result.execution_time)))
     
     if show_prompt and step_result.prompt:
-        print(f"\n{COLORS['YELLOW']}Prompt:{COLORS['ENDC']}")
-        print(wrap_text(step_result.prompt, width=width, initial_indent="  ", subsequent_indent="  "))
+        emit(_PROMPT_HEADER)
+        emit(wrap_text(step_result.prompt, width=width, initial_indent="  ", subsequent_indent="  ") + "\n")
     
     if show_full_result:
-        print(f"\n{COLORS['GREEN']}Result:{COLORS['ENDC']}")
+        emit(_RESULT_HEADER)
         formatted_result = format_result(step_result.result)
-        print(wrap_text(formatted_result, width=width, initial_indent="  ", subsequent_indent="  "))
+        emit(wrap_text(formatted_result, width=width, initial_indent="  ", subsequent_indent="  ") + "\n")
     
     if step_result.outputs and len(step_result.outputs) > 0:
-        print(f"\n{COLORS['YELLOW']}Outputs:{COLORS['ENDC']}")
+        emit(_OUTPUTS_HEADER)
+        truncate = truncate_text
+        join = "".join
         for name, value in step_result.outputs.items():
             if show_full_outputs:
                 # Format and wrap the full output
                 formatted_value = str(value)
-                print(f"  {COLORS['BOLD']}{name}:{COLORS['ENDC']}")
-                print(wrap_text(formatted_value, width=width, initial_indent="    ", subsequent_indent="    "))
+                emit(_OUTPUT_NAME.format(name))
+                emit(wrap_text(formatted_value, width=width, initial_indent="    ", subsequent_indent="    ") + "\n")
             else:
                 # Truncate the output as before
-                print(f"  {COLORS['BOLD']}{name}:{COLORS['ENDC']} {truncate_text(str(value), 100)}")
+                emit(join((_OUTPUT_ROW_PREFIX, name, _OUTPUT_ROW_SEPARATOR, truncate(str(value), 100), "\n")))
     
     if verbose:
         if step_result.model:
-            print(f"\n{COLORS['CYAN']}Model: {step_result.model}{COLORS['ENDC']}")
+            emit(_MODEL.format(step_result.model))
         if step_result.temperature is not None:
-            print(f"{COLORS['CYAN']}Temperature: {step_result.temperature}{COLORS['ENDC']}")
+            emit(_TEMPERATURE.format(step_result.temperature))
+    
+    emit("\n" + "-" * width + "\n")
     
-    print("\n" + "-" * width)
+    if out is None:
+        sys.stdout.write("".join(parts))
 
 def visualize_workflow_result(result: WorkflowResult, workflow: Optional[Workflow] = None,
                              verbose: bool = False, show_prompts: bool = False,
@@ -113,6 +174,9 @@ def visualize_workflow_result(result: WorkflowResult, workflow: Optional[Workflo
     """
     Visualize a workflow result in the terminal.
     
+    The report is assembled in memory and written to stdout in as few calls
+    as possible, one per _FLUSH_THRESHOLD characters of output.
+    
     Args:
         result: The workflow result to visualize
         workflow: Optional workflow definition for additional context
@@ -122,29 +186,49 @@ def visualize_workflow_result(result: WorkflowResult, workflow: Optional[Workflo
         show_full_outputs: Whether to show the full outputs without truncation
         width: Width of the terminal output
     """
-    print("\n" + "=" * width)
-    print(f"{COLORS['BOLD']}{COLORS['HEADER']}Workflow: {result.workflow_name}{COLORS['ENDC']}")
-    print(f"{COLORS['CYAN']}Total Execution Time: {format_time(result.total_execution_time)}{COLORS['ENDC']}")
-    print(f"{COLORS['CYAN']}Steps: {len(result.step_results)}{COLORS['ENDC']}")
-    print("=" * width + "\n")
+    parts: List[str] = []
+    emit = parts.append
+    
+    emit("\n" + "=" * width + "\n")
+    emit(_WORKFLOW_HEADER.format(result.workflow_name))
+    emit(_TOTAL_EXECUTION_TIME.format(format_time(result.total_execution_time)))
+    emit(_STEP_COUNT.format(len(result.step_results)))
+    emit("=" * width + "\n\n")
     
     # If we have the workflow definition, use it to get the step order
-    step_ids = list(result.step_results.keys())
+    step_results = result.step_results
     if workflow:
-        step_ids = [step.id for step in workflow.steps]
+        ordered_results = (
+            (step.id, step_results.get(step.id)) for step in workflow.steps
+        )
+    else:
+        ordered_results = step_results.items()
     
-    # Print each step result in order
-    for step_id in step_ids:
-        if step_id in result.step_results:
-            print_step_result(
+    # Print each step result in order, flushing whenever enough text has built up
+    write = sys.stdout.write
+    print_step = print_step_result
+    pending = sum(map(len, parts))
+    for step_id, step_result in ordered_results:
+        if step_result is not None:
+            start = len(parts)
+            print_step(
                 step_id, 
-                result.step_results[step_id], 
+                step_result, 
                 verbose=verbose,
                 show_prompt=show_prompts,
                 show_full_result=show_full_results,
                 show_full_outputs=show_full_outputs,
-                width=width
+                width=width,
+                out=parts
             )
+            pending += sum(map(len, parts[start:]))
+            if pending >= _FLUSH_THRESHOLD:
+                write("".join(parts))
+                parts.clear()
+                pending = 0
+    
+    write("".join(parts))
+    sys.stdout.flush()
 
 def load_result_from_file(file_path: str) -> WorkflowResult:
     """
@@ -156,21 +240,23 @@ def load_result_from_file(file_path: str) -> WorkflowResult:
     Returns:
         The loaded workflow result
     """
-    with open(file_path, 'r') as f:
-        data = json.load(f)
+    with open(file_path, 'rb') as f:
+        data = _json_loads(f.read())
     
-    # Convert the loaded data to a WorkflowResult
+    # Convert the loaded data to a WorkflowResult; result files are written by
+    # orchestrate itself, so the step results are built without re-validation
     step_results = {}
     for step_id, step_data in data.get("step_results", {}).items():
-        step_results[step_id] = StepResult(
-            step_id=step_data.get("step_id", step_id),
-            result=step_data.get("result", ""),
-            outputs=step_data.get("outputs", {}),
-            execution_time=step_data.get("execution_time", 0.0),
-            prompt=step_data.get("prompt"),
-            model=step_data.get("model"),
-            temperature=step_data.get("temperature"),
-            system_message=step_data.get("system_message")
+        get = step_data.get
+        step_results[step_id] = StepResult.model_construct(
+            step_id=get("step_id", step_id),
+            result=get("result", ""),
+            outputs=get("outputs", {}),
+            execution_time=get("execution_time", 0.0),
+            prompt=get("prompt"),
+            model=get("model"),
+            temperature=get("temperature"),
+            system_message=get("system_message")
         )
     
     return WorkflowResult(
@@ -197,8 +283,46 @@ def find_workflow_file(result_file_path: str) -> Optional[str]:
             return workflow_path
     return None
 
+async def _load_files(result_file: str, workflow_path: Optional[str]) -> tuple:
+    """
+    Load a result file and, if given, its workflow file concurrently.
+    
+    Both files are read and parsed on worker threads so their I/O overlaps.
+    
+    Args:
+        result_file: Path to the result JSON file
+        workflow_path: Path to the workflow YAML file, or None
+        
+    Returns:
+        Tuple of the loaded workflow result and workflow (None if unavailable)
+        
+    Raises:
+        Exception: Any error raised while loading the result file
+    """
+    import asyncio
+    
+    if not workflow_path:
+        return await asyncio.to_thread(load_result_from_file, result_file), None
+    
+    from .parser import load_workflow_from_file
+    result, workflow = await asyncio.gather(
+        asyncio.to_thread(load_result_from_file, result_file),
+        asyncio.to_thread(load_workflow_from_file, workflow_path),
+        return_exceptions=True
+    )
+    if isinstance(result, BaseException):
+        raise result
+    if isinstance(workflow, BaseException):
+        print(f"Warning: Could not load workflow file: {str(workflow)}", file=sys.stderr)
+        workflow = None
+    return result, workflow
+
 def main():
     """Main entry point for the visualizer CLI."""
+    # Imported here to keep module import cheap for library users
+    import argparse
+    import asyncio
+    
     parser = argparse.ArgumentParser(description="Orchestrate - Workflow Result Visualizer")
     parser.add_argument("result_file", help="Path to the workflow result JSON file")
     parser.add_argument("-w", "--workflow", help="Path to the workflow YAML file (optional)")
@@ -211,21 +335,15 @@ def main():
     args = parser.parse_args()
     
     try:
-        # Load the result file
-        result = load_result_from_file(args.result_file)
-        
         # Try to find the workflow file if not specified
-        workflow = None
         workflow_path = args.workflow
         if not workflow_path:
             workflow_path = find_workflow_file(args.result_file)
+        if workflow_path and not os.path.exists(workflow_path):
+            workflow_path = None
         
-        # Load the workflow if available
-        if workflow_path and os.path.exists(workflow_path):
-            try:
-                workflow = load_workflow_from_file(workflow_path)
-            except Exception as e:
-                print(f"Warning: Could not load workflow file: {str(e)}", file=sys.stderr)
+        # Load the result file and the workflow, if available, concurrently
+        result, workflow = asyncio.run(_load_files(args.result_file, workflow_path))
         
         # Visualize the result
         visualize_workflow_result(
@@ -0,0 +1,65 @@
+import os
+
+import httpx
+import pytest
+import pytest_asyncio
+from dotenv import load_dotenv
+
+# Load environment variables from .env once, before test modules are collected
+load_dotenv()
+
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+from orchestrate.llm import DEFAULT_MODEL, OpenAIClient
+
+from .openai_helpers import CachedOpenAIClient, mock_chat_completion
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def openai_client():
+    """
+    Share one AsyncOpenAI client across the test session.
+
+    Requests are multiplexed over pooled HTTP/2 connections, so tests reuse a
+    connection instead of paying for a new TCP and TLS handshake each. Tests
+    using it must run in the session event loop.
+    """
+    http_client = DefaultAsyncHttpxClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    )
+    async with AsyncOpenAI(http_client=http_client) as client:
+        yield client
+
+@pytest.fixture(params=[
+    pytest.param("unit", marks=pytest.mark.unit),
+    pytest.param("live", marks=[
+        pytest.mark.live,
+        pytest.mark.skipif(not os.getenv("OPENAI_API_KEY"), reason="OPENAI_API_KEY not set")
+    ])
+])
+def make_openai_client(request, pytestconfig):
+    """
+    Return a factory for OpenAIClients, once per test lane.
+
+    In the unit lane the clients talk to a mocked API. In the live lane they
+    share the session's openai_client, and with ORCHESTRATE_TEST_CACHE=1 their
+    responses are cached under .pytest_cache so repeated runs skip identical
+    API calls; pass cache=False for tests that need a fresh response every time.
+    """
+    if request.param == "unit":
+        # The mocked transport is injected explicitly, so no request can reach the network
+        mocked_client = AsyncOpenAI(
+            api_key="test-key",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(mock_chat_completion))
+        )
+        return lambda model=DEFAULT_MODEL, cache=True: OpenAIClient(model=model, client=mocked_client)
+
+    openai_client = request.getfixturevalue("openai_client")
+    cache_dir = pytestconfig.cache.mkdir("llm") if os.getenv("ORCHESTRATE_TEST_CACHE") == "1" else None
+
+    def make(model=DEFAULT_MODEL, cache=True):
+        if cache_dir is None or not cache:
+            return OpenAIClient(model=model, client=openai_client)
+        return CachedOpenAIClient(cache_dir, model=model, client=openai_client)
+
+    return make
@@ -0,0 +1,71 @@
+"""
+Helpers for tests that talk to the OpenAI API, shared by conftest.py and the test modules.
+"""
+
+import functools
+import hashlib
+import json
+import os
+
+import httpx
+
+from orchestrate.llm import OpenAIClient
+
+# Fast, inexpensive model for tests that don't depend on a particular model
+TEST_MODEL = os.getenv("ORCHESTRATE_TEST_MODEL") or os.getenv("OPENAI_MODEL") or "gpt-4o-mini"
+
+# Model for tests that need json_schema structured outputs, which this snapshot supports
+TEST_STRUCTURED_MODEL = (
+    os.getenv("ORCHESTRATE_TEST_STRUCTURED_MODEL") or os.getenv("OPENAI_MODEL") or "gpt-4o-mini-2024-07-18"
+)
+
+class CachedOpenAIClient(OpenAIClient):
+    """OpenAIClient that replays responses recorded on disk for identical calls."""
+
+    def __init__(self, cache_dir, **kwargs):
+        super().__init__(**kwargs)
+        self.cache_dir = cache_dir
+
+    def _cache_path(self, *key):
+        """Return the cache file for a call, named by a hash of everything that affects its response."""
+        digest = hashlib.blake2b(json.dumps(key, sort_keys=True).encode(), digest_size=16).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+
+    async def _cached(self, path, call, is_error):
+        if path.exists():
+            return json.loads(path.read_text(encoding="utf-8"))
+        result = await call()
+        # Errors are never cached, so a failed call is retried on the next run
+        if not is_error(result):
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(result), encoding="utf-8")
+            tmp_path.replace(path)
+        return result
+
+    async def generate(self, prompt, temperature=0.7, max_tokens=None, system_message="You are a helpful assistant."):
+        path = self._cache_path("generate", self.model, prompt, round(temperature, 2), max_tokens, system_message, None)
+        return await self._cached(
+            path,
+            functools.partial(super().generate, prompt, temperature, max_tokens, system_message),
+            lambda result: result.startswith("Error generating completion")
+        )
+
+# Answers the mocked API gives to the capital city prompts
+_CANNED_CAPITALS = {"France": "Paris", "Italy": "Rome", "Spain": "Madrid", "Germany": "Berlin"}
+
+def mock_chat_completion(request):
+    """Answer a chat completions request with a canned ChatCompletion."""
+    body = json.loads(request.content)
+    prompt = body["messages"][-1]["content"]
+    content = next(
+        (f"The capital of {country} is {capital}." for country, capital in _CANNED_CAPITALS.items() if country in prompt),
+        f"Mock response to {prompt!r} at temperature {body.get('temperature')}"
+    )
+    return httpx.Response(200, json={
+        "id": "chatcmpl-mock",
+        "object": "chat.completion",
+        "created": 0,
+        "model": body["model"],
+        "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": content}}],
+        "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+    })
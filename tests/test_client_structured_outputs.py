@@ -2,11 +2,10 @@
 import os
 import asyncio
 import json
+from dotenv import load_dotenv
 from src.orchestrate.llm import OpenAIClient
 
-# Load environment variables
-from dotenv import load_dotenv
-load_dotenv()
+from .openai_helpers import TEST_STRUCTURED_MODEL
 
 async def test_client_structured_output():
     """
@@ -15,7 +14,7 @@ async def test_client_structured_output():
     print("Testing structured outputs with OpenAIClient...")
     
     # Initialize the OpenAI client
-    client = OpenAIClient(api_key=os.getenv("OPENAI_API_KEY"), model="gpt-4o-2024-08-06")
+    client = OpenAIClient(api_key=os.getenv("OPENAI_API_KEY"), model=TEST_STRUCTURED_MODEL)
     
     # Define a simple output schema
     output_schema = {
@@ -67,4 +66,6 @@ async def main():
     await test_client_structured_output()
 
 if __name__ == "__main__":
+    # Under pytest, conftest.py loads .env; when run as a script, load it here
+    load_dotenv()
     asyncio.run(main()) 
\ No newline at end of file
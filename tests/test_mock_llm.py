@@ -0,0 +1,90 @@
+import asyncio
+import pytest
+
+from src.orchestrate import mock_llm
+from src.orchestrate.mock_llm import MockLLMClient, get_mock_client, generate_mock_completion
+
+def test_get_mock_client_per_delay_range():
+    """Test that each delay range gets its own shared client."""
+    default_client = get_mock_client()
+    fast_client = get_mock_client((0, 0))
+
+    assert get_mock_client() is default_client
+    assert get_mock_client((0, 0)) is fast_client
+    assert fast_client is not default_client
+    assert fast_client.delay_range == (0, 0)
+
+@pytest.mark.asyncio
+async def test_generate_mock_completion_bounds_concurrency(monkeypatch):
+    """Test that concurrent mock completions are capped by the configured limit."""
+    monkeypatch.setattr(mock_llm, "_mock_concurrency", 2)
+    monkeypatch.setattr(mock_llm, "_gate_controller", None)
+
+    active = 0
+    peak = 0
+
+    async def fake_generate(self, prompt, temperature=0.7, max_tokens=None, system_message=""):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return prompt
+
+    monkeypatch.setattr(MockLLMClient, "generate", fake_generate)
+
+    prompts = [f"prompt {i}" for i in range(8)]
+    results = await asyncio.gather(*(generate_mock_completion(prompt) for prompt in prompts))
+
+    assert results == prompts
+    assert peak == 2
+
+@pytest.mark.asyncio
+async def test_set_mock_concurrency_admits_waiters(monkeypatch):
+    """Test that growing the limit at runtime admits waiting completions."""
+    monkeypatch.setattr(mock_llm, "_mock_concurrency", 1)
+    monkeypatch.setattr(mock_llm, "_gate_controller", None)
+
+    release = asyncio.Event()
+    started = []
+
+    async def fake_generate(self, prompt, temperature=0.7, max_tokens=None, system_message=""):
+        started.append(prompt)
+        await release.wait()
+        return prompt
+
+    monkeypatch.setattr(MockLLMClient, "generate", fake_generate)
+
+    tasks = [asyncio.create_task(generate_mock_completion(f"prompt {i}")) for i in range(3)]
+    await asyncio.sleep(0.01)
+    assert len(started) == 1
+
+    await mock_llm.set_mock_concurrency(3)
+    await asyncio.sleep(0.01)
+    assert len(started) == 3
+
+    release.set()
+    assert await asyncio.gather(*tasks) == ["prompt 0", "prompt 1", "prompt 2"]
+
+@pytest.mark.asyncio
+async def test_zero_delay_client_does_not_sleep(monkeypatch):
+    """Test that a (0, 0) delay range skips the simulated latency entirely."""
+    async def fail_sleep(delay):
+        raise AssertionError("asyncio.sleep should not be called for a zero delay range")
+
+    monkeypatch.setattr(mock_llm.asyncio, "sleep", fail_sleep)
+    client = MockLLMClient(delay_range=(0, 0))
+
+    assert await client.generate("Tell me a riddle")
+    assert await client.generate_structured("Plan a market launch", {"properties": {"product_name": {"type": "string"}}})
+
+def test_seeded_clients_cycle_through_pool():
+    """Test that seeded clients are reproducible and serve every response before repeating."""
+    first = MockLLMClient(delay_range=(0, 0), seed=42)
+    second = MockLLMClient(delay_range=(0, 0), seed=42)
+
+    responses = [first._generate_riddle_response("") for _ in range(10)]
+
+    assert responses == [second._generate_riddle_response("") for _ in range(10)]
+    assert sorted(responses[:5]) == sorted(mock_llm._RIDDLE_RESPONSES)
+    assert responses[5:] == responses[:5]
@@ -5,9 +5,6 @@ import time
 from pathlib import Path
 import pytest
 
-# Set environment variable to use mock LLM
-os.environ["ORCHESTRATE_USE_MOCK"] = "true"
-
 # Add the src directory to the Python path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -15,6 +12,13 @@ from src.orchestrate.models import Workflow, WorkflowStep
 from src.orchestrate.parser import load_workflow_from_file
 from src.orchestrate.engine import execute_workflow
 
+@pytest.fixture(autouse=True)
+def use_mock_llm(monkeypatch):
+    """Use the mock LLM client for this module only, so other tests are unaffected."""
+    monkeypatch.setenv("ORCHESTRATE_USE_MOCK", "true")
+    # The default client is created once, from the environment, on first use
+    monkeypatch.setattr("orchestrate.llm._default_client", None)
+
 @pytest.mark.asyncio
 async def test_mock_workflow():
     """Test running a workflow with the mock LLM client."""
@@ -73,4 +77,6 @@ async def test_mock_workflow():
     assert len(result.step_results) > 0
 
 if __name__ == "__main__":
+    # Set environment variable to use mock LLM
+    os.environ["ORCHESTRATE_USE_MOCK"] = "true"
     asyncio.run(test_mock_workflow()) 
\ No newline at end of file
@@ -2,58 +2,49 @@
 Test the OpenAI client integration.
 
 This test verifies that the OpenAI client can generate completions.
-It requires a valid OpenAI API key in the environment.
+The live tests require a valid OpenAI API key in the environment.
 """
 
+import asyncio
 import os
+import httpx
 import pytest
-import pytest_asyncio
-from dotenv import load_dotenv
+from openai import AsyncOpenAI
 
-# Load environment variables from .env file
-load_dotenv()
+from orchestrate.engine import execute_workflow
+from orchestrate.llm import OpenAIClient, get_llm_client
+from orchestrate.mock_llm import MockLLMClient
+from orchestrate.models import Workflow, WorkflowStep
 
-# Skip tests if OPENAI_API_KEY is not set
-pytestmark = [
-    pytest.mark.skipif(
-        not os.getenv("OPENAI_API_KEY"),
-        reason="OPENAI_API_KEY not set"
-    ),
-    pytest.mark.asyncio
-]
+from .openai_helpers import TEST_MODEL, CachedOpenAIClient, mock_chat_completion
 
-async def test_generate_completion():
-    """Test that the OpenAI client can generate completions."""
+# Environment variables from .env are loaded once, in conftest.py
+
+# Tests share the session-scoped OpenAI client, so they run in the session event loop.
+# Tests using make_openai_client run in both the unit (mocked API) and live lanes.
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+# Skip live tests if OPENAI_API_KEY is not set
+requires_api_key = pytest.mark.skipif(
+    not os.getenv("OPENAI_API_KEY"),
+    reason="OPENAI_API_KEY not set"
+)
+
+@pytest.mark.parametrize("country,capital,model", [
+    ("France", "paris", TEST_MODEL),
+    ("Italy", "rome", TEST_MODEL),
+    # Different models can be selected per client
+    ("Spain", "madrid", "gpt-3.5-turbo"),
+    ("Germany", "berlin", "gpt-4o"),
+])
+async def test_capital(make_openai_client, country, capital, model):
+    """Test that the OpenAIClient class can generate completions with the selected model."""
     # Use the OpenAIClient directly instead of generate_completion
-    from orchestrate.llm import OpenAIClient
-    
-    # Create a client
-    client = OpenAIClient()
-    
-    # Generate a completion
-    result = await client.generate(
-        prompt="What is the capital of France?",
-        temperature=0.7
-    )
-    
-    # Check that we got a non-empty result
-    assert result is not None
-    assert isinstance(result, str)
-    assert len(result) > 0
-    
-    # Check that the result contains "Paris" (case insensitive)
-    assert "paris" in result.lower()
-    
-async def test_llm_client_class():
-    """Test that the OpenAIClient class can generate completions."""
-    from orchestrate.llm import OpenAIClient
-    
-    # Create a client
-    client = OpenAIClient()
+    client = make_openai_client(model=model)
     
     # Generate a completion
     result = await client.generate(
-        prompt="What is the capital of Italy?",
+        prompt=f"What is the capital of {country}?",
         temperature=0.7
     )
     
@@ -62,60 +53,29 @@ async def test_llm_client_class():
     assert isinstance(result, str)
     assert len(result) > 0
     
-    # Check that the result contains "Rome" (case insensitive)
-    assert "rome" in result.lower()
+    # Check that the result names the capital (case insensitive)
+    assert capital in result.lower()
 
-async def test_model_selection():
-    """Test that different models can be selected."""
-    from orchestrate.llm import OpenAIClient
-    
-    # Test with GPT-3.5-turbo
-    client_35 = OpenAIClient(model="gpt-3.5-turbo")
-    result_35 = await client_35.generate(
-        prompt="What is the capital of Spain?",
-        temperature=0.7
-    )
-    
-    # Check that we got a valid result
-    assert result_35 is not None
-    assert isinstance(result_35, str)
-    assert len(result_35) > 0
-    assert "madrid" in result_35.lower()
-    
-    # Test with GPT-4o
-    client_4o = OpenAIClient(model="gpt-4o")
-    result_4o = await client_4o.generate(
-        prompt="What is the capital of Germany?",
-        temperature=0.7
-    )
-    
-    # Check that we got a valid result
-    assert result_4o is not None
-    assert isinstance(result_4o, str)
-    assert len(result_4o) > 0
-    assert "berlin" in result_4o.lower()
-
-async def test_temperature_parameter():
+async def test_temperature_parameter(make_openai_client):
     """Test that the temperature parameter affects the output."""
-    from orchestrate.llm import OpenAIClient
-    
-    # Create a client
-    client = OpenAIClient()
+    # Create a client; cached responses would hide the variation this test checks for
+    client = make_openai_client(model=TEST_MODEL, cache=False)
     
     # Generate completions with different temperatures
     # Note: This test is somewhat subjective as temperature affects randomness
     # We're just checking that the API accepts the parameter without error
     
-    # Low temperature (more deterministic)
-    result_low = await client.generate(
-        prompt="Write a short poem about AI.",
-        temperature=0.1
-    )
-    
-    # High temperature (more random)
-    result_high = await client.generate(
-        prompt="Write a short poem about AI.",
-        temperature=0.9
+    # Low temperature (more deterministic) and high temperature (more random),
+    # requested concurrently since neither depends on the other
+    result_low, result_high = await asyncio.gather(
+        client.generate(
+            prompt="Write a short poem about AI.",
+            temperature=0.1
+        ),
+        client.generate(
+            prompt="Write a short poem about AI.",
+            temperature=0.9
+        )
     )
     
     # Check that we got valid results
@@ -126,13 +86,12 @@ async def test_temperature_parameter():
     # This is not guaranteed but highly likely with such different temperatures
     assert result_low != result_high
 
-async def test_workflow_with_openai():
+@pytest.mark.live
+@requires_api_key
+async def test_workflow_with_openai(monkeypatch):
     """Test that a workflow can be executed with the OpenAI integration."""
-    from orchestrate.models import Workflow, WorkflowStep
-    from orchestrate.engine import execute_workflow
-    
     # Make sure we're using the real OpenAI client
-    os.environ["ORCHESTRATE_USE_MOCK"] = "false"
+    monkeypatch.setenv("ORCHESTRATE_USE_MOCK", "false")
     
     # Create a simple workflow
     workflow = Workflow(
@@ -152,7 +111,7 @@ async def test_workflow_with_openai():
     
     # Execute the workflow with model and temperature parameters
     initial_context = {
-        "model": "gpt-3.5-turbo",  # Use a faster model for testing
+        "model": TEST_MODEL,  # Use a faster model for testing
         "temperature": 0.5
     }
     
@@ -178,24 +137,64 @@ async def test_workflow_with_openai():
     assert len(question) > 10  # Should be a reasonable question
     assert len(answer) > 10    # Should be a reasonable answer
 
-async def test_factory_pattern():
+@pytest.mark.unit
+async def test_factory_pattern(monkeypatch):
     """Test that the factory pattern works correctly."""
-    from orchestrate.llm import get_llm_client
-    from orchestrate.mock_llm import MockLLMClient
+    # Creating the real client needs a key but makes no requests
+    if not os.getenv("OPENAI_API_KEY"):
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
     
     # Test with mock client
     mock_client = get_llm_client(use_mock=True)
     assert isinstance(mock_client, MockLLMClient)
     
     # Test with real client
-    from orchestrate.llm import OpenAIClient
     real_client = get_llm_client(use_mock=False)
     assert isinstance(real_client, OpenAIClient)
     
-    # Test environment variable control
-    os.environ["ORCHESTRATE_USE_MOCK"] = "true"
+    # Test environment variable control; monkeypatch restores it for other tests
+    monkeypatch.setenv("ORCHESTRATE_USE_MOCK", "true")
     env_client = get_llm_client()
     assert isinstance(env_client, MockLLMClient)
-    
-    # Reset for other tests
-    os.environ["ORCHESTRATE_USE_MOCK"] = "false" 
\ No newline at end of file
+
+def _recording_openai(handler, requests):
+    """Return an AsyncOpenAI client whose requests are answered by handler and recorded in requests."""
+    def respond(request):
+        requests.append(request)
+        return handler(request)
+    return AsyncOpenAI(
+        api_key="test-key",
+        max_retries=0,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(respond))
+    )
+
+@pytest.mark.unit
+async def test_cached_client_replays_identical_calls(tmp_path):
+    """Test that the test response cache sends an identical call to the API only once."""
+    requests = []
+    async with _recording_openai(mock_chat_completion, requests) as openai_client:
+        client = CachedOpenAIClient(tmp_path, model=TEST_MODEL, client=openai_client)
+        
+        first = await client.generate(prompt="What is the capital of France?", temperature=0.7)
+        second = await client.generate(prompt="What is the capital of France?", temperature=0.7)
+    
+    assert "paris" in first.lower()
+    assert second == first
+    assert len(requests) == 1
+
+@pytest.mark.unit
+async def test_cached_client_does_not_cache_errors(tmp_path):
+    """Test that error responses are not written to the test response cache."""
+    requests = []
+    server_error = lambda request: httpx.Response(500, json={"error": {"message": "Server error"}})
+    async with _recording_openai(server_error, requests) as openai_client:
+        client = CachedOpenAIClient(tmp_path, model=TEST_MODEL, client=openai_client)
+        
+        result = await client.generate(prompt="What is the capital of France?")
+        assert result.startswith("Error generating completion")
+        assert list(tmp_path.iterdir()) == []
+        
+        # The failed call is retried rather than replayed
+        await client.generate(prompt="What is the capital of France?")
+    
+    assert len(requests) == 2
@@ -0,0 +1,113 @@
+"""
+Regression sweep of capital city prompts through the OpenAI Batch API.
+
+Batches cost half as much as regular requests but may take up to 24 hours,
+so this lane only runs when ORCHESTRATE_TEST_BATCH=1 is set, e.g. for
+nightly or weekly coverage runs: pytest -m batch
+"""
+
+import asyncio
+import json
+import os
+import time
+import pytest
+
+from .openai_helpers import TEST_MODEL
+
+# Give up on the batch after this many seconds
+BATCH_TIMEOUT = float(os.getenv("ORCHESTRATE_TEST_BATCH_TIMEOUT", "86400"))
+
+pytestmark = [
+    pytest.mark.batch,
+    pytest.mark.skipif(
+        os.getenv("ORCHESTRATE_TEST_BATCH") != "1" or not os.getenv("OPENAI_API_KEY"),
+        reason="ORCHESTRATE_TEST_BATCH=1 and OPENAI_API_KEY are required for the batch lane"
+    ),
+    # Uses the session-scoped OpenAI client, so runs in the session event loop
+    pytest.mark.asyncio(loop_scope="session")
+]
+
+US_STATE_CAPITALS = {
+    "Alabama": "Montgomery", "Alaska": "Juneau", "Arizona": "Phoenix", "Arkansas": "Little Rock",
+    "California": "Sacramento", "Colorado": "Denver", "Connecticut": "Hartford", "Delaware": "Dover",
+    "Florida": "Tallahassee", "Georgia": "Atlanta", "Hawaii": "Honolulu", "Idaho": "Boise",
+    "Illinois": "Springfield", "Indiana": "Indianapolis", "Iowa": "Des Moines", "Kansas": "Topeka",
+    "Kentucky": "Frankfort", "Louisiana": "Baton Rouge", "Maine": "Augusta", "Maryland": "Annapolis",
+    "Massachusetts": "Boston", "Michigan": "Lansing", "Minnesota": "Saint Paul", "Mississippi": "Jackson",
+    "Missouri": "Jefferson City", "Montana": "Helena", "Nebraska": "Lincoln", "Nevada": "Carson City",
+    "New Hampshire": "Concord", "New Jersey": "Trenton", "New Mexico": "Santa Fe", "New York": "Albany",
+    "North Carolina": "Raleigh", "North Dakota": "Bismarck", "Ohio": "Columbus", "Oklahoma": "Oklahoma City",
+    "Oregon": "Salem", "Pennsylvania": "Harrisburg", "Rhode Island": "Providence", "South Carolina": "Columbia",
+    "South Dakota": "Pierre", "Tennessee": "Nashville", "Texas": "Austin", "Utah": "Salt Lake City",
+    "Vermont": "Montpelier", "Virginia": "Richmond", "Washington": "Olympia", "West Virginia": "Charleston",
+    "Wisconsin": "Madison", "Wyoming": "Cheyenne",
+}
+
+# Batch statuses after which the batch will not change any more
+TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+def build_batch_input() -> bytes:
+    """Build the batch input file, one chat completion request per state."""
+    lines = [
+        json.dumps({
+            "custom_id": state,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": TEST_MODEL,
+                "messages": [
+                    {"role": "system", "content": "You are a helpful assistant."},
+                    {"role": "user", "content": f"What is the capital of the US state of {state}?"}
+                ],
+                "temperature": 0
+            }
+        })
+        for state in US_STATE_CAPITALS
+    ]
+    return "\n".join(lines).encode("utf-8")
+
+async def wait_for_batch(client, batch_id: str):
+    """Poll a batch with exponential backoff until it finishes or BATCH_TIMEOUT passes."""
+    deadline = time.monotonic() + BATCH_TIMEOUT
+    delay = 5.0
+    while True:
+        batch = await client.batches.retrieve(batch_id)
+        if batch.status in TERMINAL_STATUSES:
+            return batch
+        if time.monotonic() >= deadline:
+            await client.batches.cancel(batch_id)
+            pytest.fail(f"Batch {batch_id} did not finish within {BATCH_TIMEOUT:.0f}s (status: {batch.status})")
+        await asyncio.sleep(min(delay, max(deadline - time.monotonic(), 0)))
+        delay = min(delay * 2, 300.0)
+
+async def test_state_capitals_batch(openai_client):
+    """Test that every state capital prompt in a batch is answered correctly."""
+    input_file = await openai_client.files.create(
+        file=("state_capitals.jsonl", build_batch_input()),
+        purpose="batch"
+    )
+    batch = await openai_client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h"
+    )
+
+    batch = await wait_for_batch(openai_client, batch.id)
+    assert batch.status == "completed", f"Batch {batch.id} ended with status {batch.status}"
+
+    # Collect each answer by its custom_id
+    output = await openai_client.files.content(batch.output_file_id)
+    answers = {}
+    for line in output.text.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        assert record["error"] is None, f"{record['custom_id']}: {record['error']}"
+        answers[record["custom_id"]] = record["response"]["body"]["choices"][0]["message"]["content"]
+
+    assert set(answers) == set(US_STATE_CAPITALS)
+    wrong = {
+        state: answer for state, answer in answers.items()
+        if US_STATE_CAPITALS[state].lower() not in answer.lower()
+    }
+    assert not wrong, f"Unexpected answers: {wrong}"
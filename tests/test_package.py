@@ -0,0 +1,32 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+
+# Modules that the CLI and library entry points import without needing the
+# parser (and PyYAML) or the engine (and the OpenAI client)
+@pytest.mark.parametrize("module", ["orchestrate", "orchestrate.visualizer", "orchestrate.sdk"])
+def test_import_does_not_load_heavy_dependencies(module):
+    """Test that importing a module doesn't load YAML or OpenAI support it doesn't use."""
+    code = (
+        f"import sys, {module}\n"
+        "print(sorted(m for m in ('yaml', 'openai', 'orchestrate.parser', 'orchestrate.engine') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=SRC_DIR, capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "[]"
+
+def test_public_names_import_on_access():
+    """Test that the package's public names resolve to their submodule objects."""
+    import src.orchestrate as orchestrate
+    from src.orchestrate.sdk import Workflow as WorkflowBuilder
+
+    assert orchestrate.WorkflowBuilder is WorkflowBuilder
+    assert callable(orchestrate.execute_workflow)
+    with pytest.raises(AttributeError):
+        orchestrate.not_a_public_name
@@ -0,0 +1,146 @@
+from pathlib import Path
+import pytest
+import yaml
+
+from src.orchestrate.models import Workflow, WorkflowStep
+from src.orchestrate.parser import load_workflow_from_yaml, load_workflow_from_file, save_workflow_to_file, workflow_to_json
+
+EXAMPLES_DIR = Path(__file__).parent.parent / "examples"
+
+@pytest.mark.parametrize("workflow_file", sorted(EXAMPLES_DIR.glob("*.yaml")), ids=lambda p: p.name)
+def test_example_workflows_match_safe_load(workflow_file):
+    """Test that streamed parsing agrees with a plain yaml.safe_load of each example."""
+    data = yaml.safe_load(workflow_file.read_text(encoding="utf-8"))
+    workflow = load_workflow_from_file(str(workflow_file))
+
+    assert workflow.name == data["name"]
+    assert [step.id for step in workflow.steps] == [step["id"] for step in data["steps"]]
+    assert [step.prompt for step in workflow.steps] == [step["prompt"] for step in data["steps"]]
+
+def test_anchors_and_merge_keys():
+    """Test that anchors, aliases and merge keys resolve like yaml.safe_load."""
+    workflow = load_workflow_from_yaml(
+        """
+        name: Anchors
+        defaults: &defaults
+          prompt: Shared prompt
+        steps:
+          - <<: *defaults
+            id: first
+            outputs:
+              - &idea {name: idea, description: An idea}
+          - <<: *defaults
+            id: second
+            prompt: Own prompt
+            inputs:
+              - {name: idea, source: first}
+            outputs:
+              - *idea
+        """
+    )
+
+    assert [step.prompt for step in workflow.steps] == ["Shared prompt", "Own prompt"]
+    assert workflow.steps[1].inputs[0].source == "first"
+    assert workflow.steps[1].outputs[0].description == "An idea"
+
+def test_aliased_steps_list():
+    """Test that a steps list defined under an anchor elsewhere is accepted via its alias."""
+    workflow = load_workflow_from_yaml(
+        """
+        shared: &steps
+          - id: only
+            prompt: Shared step
+        name: Aliased
+        steps: *steps
+        """
+    )
+
+    assert [step.id for step in workflow.steps] == ["only"]
+
+def test_standard_tags_on_ignored_keys():
+    """Test that standard YAML tags are constructed like yaml.safe_load, even on keys the parser ignores."""
+    workflow = load_workflow_from_yaml(
+        """
+        name: Tagged
+        labels: !!set {a, b}
+        steps: !!seq
+          - id: first
+            prompt: !!str 42
+        """
+    )
+
+    assert [step.prompt for step in workflow.steps] == ["42"]
+
+@pytest.mark.parametrize("yaml_content,message", [
+    ("", "YAML content must be a dictionary"),
+    ("- just a list", "YAML content must be a dictionary"),
+    ("steps: []", "Workflow must have a name"),
+    ("name: x\nsteps: 3", "Workflow must have a list of steps"),
+    ("name: x\nsteps:\n  - 3", "Step 0 must be a dictionary"),
+    ("name: x\nsteps:\n  - prompt: p", "Step 0 must have an id"),
+    ("name: x\nsteps:\n  - id: a", "Step 0 must have a prompt"),
+    ("name: x\nsteps: []\n---\nname: y", "expected a single document"),
+    ("name: x\n? [a, b]\n: 1\nsteps: []", "found unhashable key"),
+    ("name: x\nsteps:\n  - {id: a, prompt: p, outputs: [{name: o, description: [d]}]}", "validation error for StepIO"),
+])
+def test_invalid_workflows(yaml_content, message):
+    """Test that invalid workflows raise ValueError with a helpful message."""
+    with pytest.raises(ValueError, match=message):
+        load_workflow_from_yaml(yaml_content)
+
+@pytest.mark.parametrize("workflow_file", sorted(EXAMPLES_DIR.glob("*.yaml")), ids=lambda p: p.name)
+def test_workflow_to_json_round_trip(workflow_file):
+    """Test that workflow_to_json output validates back into an equal workflow."""
+    workflow = load_workflow_from_file(str(workflow_file))
+
+    assert Workflow.model_validate_json(workflow_to_json(workflow)) == workflow
+
+def test_load_workflow_from_file_cached_until_changed(tmp_path):
+    """Test that repeated loads return independent copies and pick up changes to the file."""
+    workflow_file = tmp_path / "workflow.yaml"
+    workflow_file.write_text("name: First\nsteps:\n  - {id: a, prompt: p}\n", encoding="utf-8")
+
+    first = load_workflow_from_file(str(workflow_file))
+    first.name = "Edited"
+    first.steps[0].prompt = "edited"
+
+    again = load_workflow_from_file(str(workflow_file))
+    assert again is not first
+    assert again.name == "First"
+    assert again.steps[0].prompt == "p"
+
+    # Same size as the original content, so only the content itself has changed
+    workflow_file.write_text("name: Other\nsteps:\n  - {id: a, prompt: p}\n", encoding="utf-8")
+    assert load_workflow_from_file(str(workflow_file)).name == "Other"
+
+def test_load_workflow_from_missing_file():
+    """Test that a missing file raises FileNotFoundError naming the path."""
+    with pytest.raises(FileNotFoundError, match="File not found: missing.yaml"):
+        load_workflow_from_file("missing.yaml")
+
+# pydantic warns when serializing the unvalidated value
+@pytest.mark.filterwarnings("ignore::UserWarning")
+def test_failed_save_keeps_existing_file(tmp_path):
+    """Test that a workflow that can't be serialized leaves the existing file untouched."""
+    workflow_file = tmp_path / "workflow.yaml"
+    workflow_file.write_text("name: Original\nsteps: []\n", encoding="utf-8")
+    # model_construct skips validation, so the prompt can hold a value YAML can't represent
+    workflow = Workflow.model_construct(
+        name="Broken", description="", version="",
+        steps=[WorkflowStep.model_construct(id="a", prompt=object(), inputs=[], outputs=[])]
+    )
+
+    with pytest.raises(yaml.YAMLError):
+        save_workflow_to_file(workflow, str(workflow_file))
+
+    assert workflow_file.read_text(encoding="utf-8") == "name: Original\nsteps: []\n"
+    assert list(tmp_path.iterdir()) == [workflow_file]
+
+def test_save_workflow_to_file_round_trip(tmp_path):
+    """Test that a saved workflow loads back unchanged."""
+    workflow_file = tmp_path / "workflow.yaml"
+    workflow = load_workflow_from_file(str(sorted(EXAMPLES_DIR.glob("*.yaml"))[0]))
+
+    save_workflow_to_file(workflow, str(workflow_file))
+
+    assert load_workflow_from_file(str(workflow_file)) == workflow
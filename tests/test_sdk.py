@@ -0,0 +1,124 @@
+import textwrap
+
+from src.orchestrate.sdk import Workflow, Step, Input, Output
+
+def build_workflow() -> Workflow:
+    """Build a small two-step workflow."""
+    workflow = Workflow("SDK Workflow").description("A workflow built in code")
+    workflow.add_step(
+        Step("draft")
+        .prompt("Write about {{topic}}")
+        .add_input("topic", source="user")
+        .add_output("draft")
+    )
+    workflow.add_step(
+        Step("review")
+        .prompt("Review {{draft}}")
+        .add_input("draft", source="draft")
+    )
+    return workflow
+
+def test_to_model_is_cached_until_changed():
+    """Test that to_model reuses its result until the workflow changes."""
+    workflow = build_workflow()
+    model = workflow.to_model()
+
+    assert workflow.to_model() is model
+    assert workflow.to_yaml() is workflow.to_yaml()
+
+    workflow.version("2.0")
+    updated = workflow.to_model()
+    assert updated is not model
+    assert updated.version == "2.0"
+
+def test_step_changes_invalidate_workflow_model():
+    """Test that changing a step after adding it is reflected in the workflow model."""
+    workflow = build_workflow()
+    model = workflow.to_model()
+    yaml_content = workflow.to_yaml()
+
+    workflow._steps[1].add_output("verdict")
+
+    updated = workflow.to_model()
+    assert updated is not model
+    assert [output.name for output in updated.steps[1].outputs] == ["verdict"]
+    assert "verdict" in workflow.to_yaml()
+    assert "verdict" not in yaml_content
+
+def test_yaml_round_trip(tmp_path):
+    """Test that a saved workflow loads back with the same model."""
+    workflow = build_workflow()
+    file_path = tmp_path / "workflow.yaml"
+    workflow.save(str(file_path))
+
+    assert Workflow.from_file(str(file_path)).to_model() == workflow.to_model()
+    assert Workflow.from_yaml(workflow.to_yaml()).to_model() == workflow.to_model()
+
+def test_step_context_manager_adds_each_step_once():
+    """Test that steps built in a with block are added exactly once."""
+    workflow = Workflow("Context Workflow")
+    with workflow.step("first") as first:
+        first.prompt("First prompt")
+    with workflow.step("second") as second:
+        second.prompt("Second prompt")
+
+    workflow.add_step(first)
+    workflow.add_steps([first, second])
+
+    assert [step.id for step in workflow.to_model().steps] == ["first", "second"]
+
+def test_prompt_is_dedented_and_stripped():
+    """Test that prompts are cleaned exactly like textwrap.dedent(...).strip()."""
+    text = """
+        First line
+          Indented line
+    \t
+        Last line
+    """
+
+    assert Step("clean").prompt(text)._prompt == textwrap.dedent(text).strip()
+
+def test_from_yaml_shares_io_models():
+    """Test that identical I/O specifications share one model after loading."""
+    workflow = Workflow.from_yaml(
+        """
+        name: Shared IO
+        steps:
+          - id: first
+            prompt: "  First prompt  "
+            outputs:
+              - {name: idea, description: An idea}
+          - id: second
+            prompt: "  Second prompt  "
+            inputs:
+              - {name: idea, source: first}
+            outputs:
+              - {name: idea, description: An idea}
+        """
+    )
+    first, second = workflow.to_model().steps
+
+    assert first.prompt == "First prompt"
+    assert first.outputs[0] is second.outputs[0]
+    assert second.inputs[0].source is first.id
+
+def test_from_file_does_not_share_loaded_models(tmp_path):
+    """Test that models from a loaded workflow are not shared with other loads of the same file."""
+    workflow_file = tmp_path / "workflow.yaml"
+    workflow_file.write_text("name: Shared\nsteps:\n  - id: only\n    prompt: Prompt\n", encoding="utf-8")
+
+    first = Workflow.from_file(str(workflow_file)).to_model()
+    first.steps[0].prompt = "Changed"
+    first.steps.append(first.steps[0])
+
+    second = Workflow.from_file(str(workflow_file)).to_model()
+    assert second is not first
+    assert [step.prompt for step in second.steps] == ["Prompt"]
+
+def test_io_builders_are_hashable_by_identity():
+    """Test that Input and Output builders keep identity-based equality and hashing."""
+    first, second = Input("idea", source="draft"), Input("idea", source="draft")
+    output = Output("idea")
+
+    assert first != second
+    assert len({first, second, output}) == 3
@@ -1,12 +1,11 @@
 #!/usr/bin/env python3
 import os
 import asyncio
-import json
+import orjson
 from openai import AsyncOpenAI
-
-# Load environment variables
 from dotenv import load_dotenv
-load_dotenv()
+
+from .openai_helpers import TEST_STRUCTURED_MODEL
 
 async def test_structured_output():
     """
@@ -44,7 +43,7 @@ async def test_structured_output():
     try:
         print("\nTest 1: Using correct format with response_format.type = 'json_object'")
         response = await client.chat.completions.create(
-            model="gpt-4o",
+            model=TEST_STRUCTURED_MODEL,
             messages=[
                 {"role": "system", "content": "You are a helpful assistant."},
                 {"role": "user", "content": "Generate information about a fictional person including their name, age, and hobbies. Return the result as JSON."}
@@ -56,9 +55,9 @@ async def test_structured_output():
         print(f"Response: {response.choices[0].message.content}")
         # Try to parse the JSON
         try:
-            parsed = json.loads(response.choices[0].message.content)
-            print(f"Successfully parsed JSON: {json.dumps(parsed, indent=2)}")
-        except json.JSONDecodeError as e:
+            parsed = orjson.loads(response.choices[0].message.content)
+            print(f"Successfully parsed JSON: {orjson.dumps(parsed, option=orjson.OPT_INDENT_2).decode()}")
+        except orjson.JSONDecodeError as e:
             print(f"Failed to parse JSON: {e}")
     
     except Exception as e:
@@ -68,7 +67,7 @@ async def test_structured_output():
     try:
         print("\nTest 2: Using structured outputs with json_schema")
         response = await client.chat.completions.create(
-            model="gpt-4o-2024-08-06",  # Make sure to use a model that supports structured outputs
+            model=TEST_STRUCTURED_MODEL,  # Make sure to use a model that supports structured outputs
             messages=[
                 {"role": "system", "content": "You are a helpful assistant."},
                 {"role": "user", "content": "Generate information about a fictional person including their name, age, and hobbies. Return the result as JSON."}
@@ -86,9 +85,9 @@ async def test_structured_output():
         print(f"Response: {response.choices[0].message.content}")
         # Try to parse the JSON
         try:
-            parsed = json.loads(response.choices[0].message.content)
-            print(f"Successfully parsed JSON: {json.dumps(parsed, indent=2)}")
-        except json.JSONDecodeError as e:
+            parsed = orjson.loads(response.choices[0].message.content)
+            print(f"Successfully parsed JSON: {orjson.dumps(parsed, option=orjson.OPT_INDENT_2).decode()}")
+        except orjson.JSONDecodeError as e:
             print(f"Failed to parse JSON: {e}")
     
     except Exception as e:
@@ -98,7 +97,7 @@ async def test_structured_output():
     try:
         print("\nTest 3: Using basic json_object format (fallback)")
         response = await client.chat.completions.create(
-            model="gpt-4o",
+            model=TEST_STRUCTURED_MODEL,
             messages=[
                 {"role": "system", "content": "You are a helpful assistant. Return your response as a JSON object with the following structure: {\"name\": \"person name\", \"age\": person age, \"hobbies\": [\"hobby1\", \"hobby2\", ...]}"},
                 {"role": "user", "content": "Generate information about a fictional person including their name, age, and hobbies. Return the result as JSON."}
@@ -110,9 +109,9 @@ async def test_structured_output():
         print(f"Response: {response.choices[0].message.content}")
         # Try to parse the JSON
         try:
-            parsed = json.loads(response.choices[0].message.content)
-            print(f"Successfully parsed JSON: {json.dumps(parsed, indent=2)}")
-        except json.JSONDecodeError as e:
+            parsed = orjson.loads(response.choices[0].message.content)
+            print(f"Successfully parsed JSON: {orjson.dumps(parsed, option=orjson.OPT_INDENT_2).decode()}")
+        except orjson.JSONDecodeError as e:
             print(f"Failed to parse JSON: {e}")
     
     except Exception as e:
@@ -122,4 +121,6 @@ async def main():
     await test_structured_output()
 
 if __name__ == "__main__":
+    # Under pytest, conftest.py loads .env; when run as a script, load it here
+    load_dotenv()
     asyncio.run(main()) 
\ No newline at end of file
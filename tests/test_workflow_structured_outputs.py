@@ -1,13 +1,11 @@
 #!/usr/bin/env python3
-import os
 import asyncio
 import json
+from dotenv import load_dotenv
 from src.orchestrate.models import Workflow, WorkflowStep, StepIO
 from src.orchestrate.engine import execute_workflow, create_output_schema
 
-# Load environment variables
-from dotenv import load_dotenv
-load_dotenv()
+from .openai_helpers import TEST_STRUCTURED_MODEL
 
 async def test_workflow_structured_outputs():
     """
@@ -59,7 +57,7 @@ async def test_workflow_structured_outputs():
         result = await execute_workflow(
             workflow,
             initial_context={
-                "model": os.getenv("OPENAI_MODEL", "gpt-4o-2024-08-06"),
+                "model": TEST_STRUCTURED_MODEL,
                 "temperature": 0.7
             },
             on_step_start=on_step_start,
@@ -96,4 +94,6 @@ async def main():
     await test_workflow_structured_outputs()
 
 if __name__ == "__main__":
+    # Under pytest, conftest.py loads .env; when run as a script, load it here
+    load_dotenv()
     asyncio.run(main()) 
\ No newline at end of file